@@ -0,0 +1,82 @@
+"""
+Helpers for the build cache shared by the pre-build steps.
+
+The repository and serialization steps each keep a manifest of headers that
+cannot need processing, keyed by path with an [mtime_ns, size] signature, in
+the library's .springbootplusplus_data_cache directory.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, Optional
+
+
+def write_content(file_path: str, content: str) -> bool:
+    """
+    Write text to a file, returning False if it cannot be written.
+    
+    The content goes to a temporary file in the same directory that then
+    replaces the original, so an interrupted write never leaves a truncated
+    file behind. Symlinked files are written in place, since replacing
+    them would turn the link into a regular file.
+    """
+    try:
+        if os.path.islink(file_path):
+            with open(file_path, 'w', encoding='utf-8') as f:
+                f.write(content)
+            return True
+        
+        directory = os.path.dirname(os.path.abspath(file_path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.tmp_', text=True)
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+            # mkstemp creates the file owner-only; keep the original's permissions
+            if os.path.exists(file_path):
+                shutil.copymode(file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+        return True
+    except Exception as e:
+        # print(f"Error writing file {file_path}: {e}")
+        return False
+
+
+def load_manifest(cache_dir: str, file_name: str) -> Dict[str, list]:
+    """Load a {path: [mtime_ns, size]} manifest, or return an empty one if missing or unreadable."""
+    try:
+        with open(os.path.join(cache_dir, file_name), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def save_manifest(cache_dir: str, file_name: str, manifest: Dict[str, list]) -> bool:
+    """Write a manifest to the cache directory, returning False if it cannot be written."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError:
+        return False
+    return write_content(os.path.join(cache_dir, file_name), json.dumps(manifest, sort_keys=True))
+
+
+def file_signature(file_path: str) -> Optional[list]:
+    """Return [mtime_ns, size] for a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+__all__ = [
+    'write_content',
+    'load_manifest',
+    'save_manifest',
+    'file_signature',
+]
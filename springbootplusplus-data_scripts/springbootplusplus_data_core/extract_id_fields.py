@@ -22,11 +22,14 @@ Patterns supported:
   int someVar;
 """
 
+import bisect
+import functools
+import mmap
 import re
 import sys
 import os
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable
 
 # print("Executing springbootplusplus_data_core/extract_id_fields.py")
 
@@ -55,74 +58,418 @@ except Exception as e:
     HAS_SERIALIZATIONLIB = False
 
 
-def check_has_serializable_macro(file_path: str, serializable_macro: str = "_Entity") -> Optional[Dict[str, any]]:
+class IdField:
+    """
+    A field marked with the @Id annotation.
+    
+    Uses __slots__ so each record is much smaller than a dict, while keeping
+    the read-only mapping interface (field['type'], field.get('validation_macros', []),
+    'validation_macros' in field) that callers used when fields were plain
+    dictionaries. 'validation_macros' is only present when there are any.
+    """
+    
+    __slots__ = ('type', 'name', 'validation_macros')
+    
+    def __init__(self, type: str, name: str, validation_macros: Iterable[str] = ()):
+        self.type = type
+        self.name = name
+        self.validation_macros = tuple(validation_macros)
+    
+    def keys(self) -> List[str]:
+        """Return the keys of the equivalent dictionary."""
+        if self.validation_macros:
+            return ['type', 'name', 'validation_macros']
+        return ['type', 'name']
+    
+    def __getitem__(self, key: str):
+        if key == 'validation_macros' and self.validation_macros:
+            return list(self.validation_macros)
+        if key == 'type' or key == 'name':
+            return getattr(self, key)
+        raise KeyError(key)
+    
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key) -> bool:
+        return key in self.keys()
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.keys())
+    
+    def as_dict(self) -> Dict[str, any]:
+        """Return the field as a plain dictionary (e.g. for JSON output)."""
+        return {key: self[key] for key in self.keys()}
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, IdField):
+            return (self.type, self.name, self.validation_macros) == (other.type, other.name, other.validation_macros)
+        if isinstance(other, dict):
+            return self.as_dict() == other
+        return NotImplemented
+    
+    def __hash__(self) -> int:
+        return hash((self.type, self.name, self.validation_macros))
+    
+    def __repr__(self) -> str:
+        return f"IdField({self.as_dict()!r})"
+
+
+def id_fields_to_dicts(id_fields: List[IdField]) -> List[Dict[str, any]]:
+    """Convert IdField records to plain dictionaries."""
+    return [field.as_dict() for field in id_fields]
+
+
+# Annotation name for each serializable macro; anything else defaults to @Serializable
+_MACRO_TO_ANNOTATION = {
+    '_Entity': '@Entity',
+    'Serializable': '@Serializable',
+}
+
+
+def annotation_name_for_macro(serializable_macro: str) -> str:
+    """Map a macro name (Serializable -> @Serializable, _Entity -> @Entity) to its annotation."""
+    return _MACRO_TO_ANNOTATION.get(serializable_macro, '@Serializable')
+
+
+# Patterns used on every scanned line are compiled once at import time
+# Characters of C++ identifiers and of the field types accepted in declarations
+# ("int rollNo;", "StdString name;", "const long digit;", "Map<K,V>* ptr = ...;")
+_IDENTIFIER_START = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz_')
+_IDENTIFIER_CHARS = _IDENTIFIER_START | frozenset('0123456789')
+_FIELD_TYPE_CHARS = _IDENTIFIER_CHARS | frozenset('<>*&,')
+_FIELD_ACCESS_PREFIXES = ('Public', 'Private', 'Protected')
+# Class declaration followed by ':' or '{'
+_CLASS_DECL_RE = re.compile(r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])')
+# Access specifiers and other annotations/macros that end an @Id look-ahead
+_ACCESS_SPECIFIERS = frozenset(('public', 'private', 'protected'))
+_STOP_TOKENS = frozenset(('Dto', 'Serializable', '_Entity', 'COMPONENT', 'SCOPE', 'VALIDATE'))
+_STOP_DOC_ANNOTATIONS = frozenset(('@Id', '@Entity', '@Serializable', '@NotNull', '@NotEmpty', '@NotBlank'))
+
+
+def _field_type_variants(prefix: str):
+    """Yield the candidate type texts of a declaration prefix, with and without modifiers."""
+    for access in _FIELD_ACCESS_PREFIXES:
+        if prefix.startswith(access):
+            rest = prefix[len(access):].lstrip()
+            if rest.startswith('const') and rest[5:6].isspace():
+                yield rest[5:].lstrip()
+            yield rest
+            break
+    if prefix.startswith('const') and prefix[5:6].isspace():
+        yield prefix[5:].lstrip()
+    yield prefix
+
+
+def _parse_field_declaration(stripped: str) -> Optional[tuple]:
+    """
+    Parse a member variable declaration such as "const long digit;" or "int id = 0;".
+    
+    A linear scan equivalent to matching
+    ^(?:Public|Private|Protected)?\s*(?:const\s+)?(type)\s+(name)\s*[;=]
+    without the backtracking a lazy type pattern needs: the declaration ends at
+    the first ';' or '=', the name is the identifier right before it and the
+    type is what precedes the name (after optional access macro and const).
+    
+    Args:
+        stripped: Line with surrounding whitespace removed
+        
+    Returns:
+        Tuple of (type, name), or None if the line is not a field declaration
+    """
+    end = len(stripped)
+    for terminator in (';', '='):
+        pos = stripped.find(terminator, 0, end)
+        if pos != -1:
+            end = pos
+    if end == len(stripped):
+        return None
+    
+    head = stripped[:end].rstrip()
+    name_start = len(head)
+    while name_start > 0 and head[name_start - 1] in _IDENTIFIER_CHARS:
+        name_start -= 1
+    name = head[name_start:]
+    if not name or name[0] not in _IDENTIFIER_START:
+        return None
+    if name_start == 0 or not head[name_start - 1].isspace():
+        return None
+    
+    prefix = head[:name_start].rstrip()
+    for field_type in _field_type_variants(prefix):
+        if field_type and field_type[0] in _IDENTIFIER_START and all(c in _FIELD_TYPE_CHARS or c.isspace() for c in field_type):
+            return field_type, name
+    return None
+
+
+def _is_access_specifier(stripped: str) -> bool:
+    """Check for a 'public:' / 'private:' / 'protected:' line (any case) on a stripped line."""
+    head, sep, _ = stripped.partition(':')
+    return bool(sep) and head.rstrip().lower() in _ACCESS_SPECIFIERS
+
+
+def _is_stop_line(stripped: str) -> bool:
+    """Check whether a stripped line is a bare macro or /// annotation that ends an @Id look-ahead."""
+    if stripped in _STOP_TOKENS:
+        return True
+    return stripped.startswith('///') and stripped[3:].lstrip() in _STOP_DOC_ANNOTATIONS
+
+
+def _has_annotation(text: str, annotation_name: str, processed: bool = False) -> bool:
+    """
+    Check whether text contains a block-comment annotation such as /* @Id */.
+    
+    Equivalent to searching for /\*\s*@Id\s*\*/ (or /\*--\s*@Id\s*--\*/ when
+    processed is True), but done with str.find and fixed-prefix checks, which
+    is much cheaper than a regex for these short literal markers.
+    
+    Args:
+        text: Line to check
+        annotation_name: Annotation including '@', e.g. '@Id' or '@Entity'
+        processed: Look for the processed /*--@Name--*/ form instead
+        
+    Returns:
+        True if the annotation is present
+    """
+    opener, closer = ('/*--', '--*/') if processed else ('/*', '*/')
+    pos = text.find(annotation_name)
+    while pos != -1:
+        end = pos + len(annotation_name)
+        if text[:pos].rstrip().endswith(opener) and text[end:].lstrip().startswith(closer):
+            return True
+        pos = text.find(annotation_name, end)
+    return False
+
+
+@functools.lru_cache(maxsize=64)
+def _class_scan_pattern(class_name: str):
+    """
+    Return the compiled tokenizer used to find the body of class_name.
+    
+    Comments and string/char literals are matched (and ignored) as whole
+    tokens so braces inside them are not counted; the named group 'decl'
+    marks the class declaration.
+    """
+    return re.compile(
+        r'/\*.*?\*/|//[^\n]*|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\''
+        rf'|(?P<decl>\bclass\s+{re.escape(class_name)}\b)|[{{}};]',
+        re.DOTALL
+    )
+
+
+def _find_class_boundaries_in_lines(lines: List[str], class_name: str) -> Optional[tuple]:
+    """
+    Find the start and end line numbers of a class with one pass over the joined text.
+    
+    Args:
+        lines: Lines of the C++ file
+        class_name: Name of the class to find
+        
+    Returns:
+        Tuple of (start_line, end_line) or None if not found
+    """
+    text = ''.join(lines)
+    decl_pos = None
+    depth = 0
+    
+    for match in _class_scan_pattern(class_name).finditer(text):
+        token = match.group()
+        if match.group('decl'):
+            if decl_pos is None:
+                decl_pos = match.start()
+        elif decl_pos is None:
+            continue
+        elif token == '{':
+            depth += 1
+        elif token == '}':
+            depth -= 1
+            if depth == 0:
+                return (text.count('\n', 0, decl_pos) + 1, text.count('\n', 0, match.start()) + 1)
+        elif token == ';' and depth == 0:
+            # Forward declaration (class Name;), keep looking for the definition
+            decl_pos = None
+    
+    return None
+
+
+# Per-run memoization of parsed headers, keyed by (abspath, mtime_ns, size, macro,
+# project_dir, library_dir) so a file that gets rewritten (e.g. after injection) is
+# parsed again, and a change of directories rediscovers the validation macros
+_RESULT_CACHE: Dict[tuple, Dict[str, any]] = {}
+_CHECK_CACHE: Dict[tuple, Optional[Dict[str, any]]] = {}
+
+
+def _cache_key(file_path: str, serializable_macro: str) -> Optional[tuple]:
+    """Build the memoization key for a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (os.path.abspath(file_path), st.st_mtime_ns, st.st_size, serializable_macro) + _validation_dirs()
+
+
+def _validation_dirs() -> tuple:
+    """Return the (project_dir, library_dir) the validation macros are discovered from."""
+    return (os.environ.get('PROJECT_DIR') or os.environ.get('CMAKE_PROJECT_DIR'), os.environ.get('LIBRARY_DIR'))
+
+
+def clear_caches() -> None:
+    """Drop all memoized results (e.g. between independent build runs)."""
+    _RESULT_CACHE.clear()
+    _CHECK_CACHE.clear()
+    _read_lines_cached.cache_clear()
+    _discover_validation_macros.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _needles_pattern(needles: tuple):
+    """Compile one alternation matching any of the given byte strings."""
+    return re.compile(b'|'.join(re.escape(needle) for needle in needles))
+
+
+def _file_contains(file_path: str, *needles: bytes) -> Optional[tuple]:
+    """
+    Check whether a file contains each of the given byte strings without decoding it.
+    
+    The file is memory-mapped and all needles are searched for in a single
+    pass with one alternation pattern, stopping as soon as every needle has
+    been seen, so headers without the annotations are rejected without
+    reading them into Python strings or scanning them once per needle.
+    
+    Returns:
+        Tuple of True/False per needle, or None if the file cannot be opened
+    """
+    try:
+        with open(file_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return (False,) * len(needles)
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                seen = set()
+                for match in _needles_pattern(needles).finditer(mm):
+                    seen.add(match.group())
+                    if len(seen) == len(needles):
+                        break
+                return tuple(needle in seen for needle in needles)
+    except (OSError, ValueError):
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _read_lines_cached(abs_path: str, mtime_ns: int, size: int) -> Optional[tuple]:
+    """Read a file revision; mtime_ns and size are part of the cache key only."""
+    try:
+        with open(abs_path, 'r', encoding='utf-8') as file:
+            return tuple(file.readlines())
+    except Exception as e:
+        # print(f"Error reading file '{abs_path}': {e}")
+        return None
+
+
+def read_lines(file_path: str) -> Optional[tuple]:
+    """
+    Read the lines of a file, reusing the previous read if the file is unchanged.
+    
+    The annotation check, class boundary search, @Id scan and primary key
+    injection all work on the same buffer instead of re-reading the file.
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        Tuple of lines (with line endings), or None if the file cannot be read
+    """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return _read_lines_cached(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+
+
+def check_has_serializable_macro(file_path: str, serializable_macro: str = "_Entity", lines: Optional[List[str]] = None) -> Optional[Dict[str, any]]:
     """
     Check if a file has the @Serializable or @Entity annotation.
     
     Args:
         file_path: Path to the C++ file
         serializable_macro: Name of the macro (Serializable -> @Serializable, _Entity -> @Entity)
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
         Dictionary with 'class_name', 'has_dto', 'line_number' if found, None otherwise
     """
+    if lines is not None:
+        return _check_has_serializable_macro(file_path, serializable_macro, lines)
+    
+    key = _cache_key(file_path, serializable_macro)
+    if key is not None and key in _CHECK_CACHE:
+        dto_info = _CHECK_CACHE[key]
+    else:
+        dto_info = _check_has_serializable_macro(file_path, serializable_macro, None)
+        if key is not None:
+            _CHECK_CACHE[key] = dto_info
+    # Hand out a copy so a caller that edits the result cannot corrupt the cache
+    return dict(dto_info) if dto_info else dto_info
+
+
+def _check_has_serializable_macro(file_path: str, serializable_macro: str, lines: Optional[List[str]]) -> Optional[Dict[str, any]]:
+    """Uncached implementation of check_has_serializable_macro."""
     if HAS_SERIALIZATIONLIB:
-        return S1_check_dto_macro.check_dto_macro(file_path, serializable_macro)
+        return S1_check_dto_macro.check_dto_macro(file_path, serializable_macro, lines)
     else:
         # Fallback implementation
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
-        except Exception as e:
-            # print(f"Error reading file '{file_path}': {e}")
-            return None
+        if lines is None:
+            lines = read_lines(file_path)
+            if lines is None:
+                return None
         
         # Determine annotation name based on macro name
-        if serializable_macro == "_Entity":
-            annotation_name = "@Entity"
-        elif serializable_macro == "Serializable":
-            annotation_name = "@Serializable"
-        else:
-            # Default to @Serializable for backward compatibility
-            annotation_name = "@Serializable"
+        annotation_name = annotation_name_for_macro(serializable_macro)
         
         # Pattern to match /* @Entity */ or /*@Entity*/ or /* @Serializable */ or /*@Serializable*/ annotation (ignoring whitespace)
         # Also check for already processed /*--@Entity--*/ or /*--@Serializable--*/ pattern
-        annotation_pattern = rf'/\*\s*{re.escape(annotation_name)}\s*\*/'
-        processed_pattern = rf'/\*--\s*{re.escape(annotation_name)}\s*--\*/'
-        class_pattern = r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])'
         
-        for line_num, line in enumerate(lines, 1):
-            stripped_line = line.strip()
+        # Strip every line once; the look-ahead below revisits the same lines
+        stripped_lines = [line.strip() for line in lines]
+        
+        for line_num, stripped_line in enumerate(stripped_lines, 1):
+            # Only lines containing the annotation name can start a match
+            if annotation_name not in stripped_line:
+                continue
             
             # Check if line is already processed (/*--@Entity--*/ or /*--@Serializable--*/)
-            if re.search(processed_pattern, stripped_line):
+            if _has_annotation(stripped_line, annotation_name, processed=True):
                 continue
             
             # Skip other comments that aren't @Entity/@Serializable annotations
             # But allow /* @Entity */ or /* @Serializable */ annotations to be processed
-            if stripped_line.startswith('/*') and not re.search(annotation_pattern, stripped_line):
+            if stripped_line.startswith('/*') and not _has_annotation(stripped_line, annotation_name):
                 continue
             # Skip single-line comments
             if stripped_line.startswith('//'):
                 continue
             
             # Check for annotation (/* @Entity */ or /*@Entity*/ or /* @Serializable */ or /*@Serializable*/)
-            annotation_match = re.search(annotation_pattern, stripped_line)
+            annotation_match = _has_annotation(stripped_line, annotation_name)
             if annotation_match:
-                for i in range(line_num, min(line_num + 11, len(lines) + 1)):
-                    if i <= len(lines):
-                        next_line = lines[i - 1].strip()
+                for i in range(line_num, min(line_num + 11, len(stripped_lines) + 1)):
+                    if i <= len(stripped_lines):
+                        next_line = stripped_lines[i - 1]
                         
                         # Skip other comments that aren't annotations
                         # But allow /* @Entity */ or /* @Serializable */ annotations to be processed
-                        if next_line.startswith('/*') and not re.search(annotation_pattern, next_line):
+                        if next_line.startswith('/*') and not _has_annotation(next_line, annotation_name):
                             continue
                         # Skip single-line comments
                         if next_line.startswith('//'):
                             continue
                         
-                        class_match = re.search(class_pattern, next_line)
+                        class_match = _CLASS_DECL_RE.search(next_line)
                         if class_match:
                             class_name = class_match.group(1)
                             return {
@@ -135,7 +482,7 @@ def check_has_serializable_macro(file_path: str, serializable_macro: str = "_Ent
         return {'has_dto': False}
 
 
-def extract_id_fields(file_path: str, class_name: str, validation_macros: Dict[str, str] = None) -> List[Dict[str, str]]:
+def extract_id_fields(file_path: str, class_name: str, validation_macros: Dict[str, str] = None, lines: Optional[List[str]] = None) -> List[IdField]:
     """
     Extract all fields marked with @Id annotation.
     
@@ -143,177 +490,271 @@ def extract_id_fields(file_path: str, class_name: str, validation_macros: Dict[s
         file_path: Path to the C++ file
         class_name: Name of the class
         validation_macros: Optional dictionary of validation macros to recognize
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
-        List of dictionaries with 'type', 'name', and optional 'validation_macros' keys
-        Example: [{'type': 'int', 'name': 'rollNo'}, {'type': 'StdString', 'name': 'name', 'validation_macros': ['NotNull']}]
+        List of IdField records; each also reads like a dictionary with 'type', 'name',
+        and optional 'validation_macros' keys
+        Example: [IdField({'type': 'int', 'name': 'rollNo'}), IdField({'type': 'StdString', 'name': 'name', 'validation_macros': ['NotNull']})]
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except Exception as e:
-        # print(f"Error reading file: {e}")
-        return []
-    
-    # Find class boundaries
-    if HAS_SERIALIZATIONLIB:
-        boundaries = S2_extract_dto_fields.find_class_boundaries(file_path, class_name)
-    else:
-        # Fallback implementation
-        boundaries = None
-        class_start = None
-        brace_count = 0
-        in_class = False
-        class_pattern = rf'class\s+{re.escape(class_name)}'
-        
-        for line_num, line in enumerate(lines, 1):
-            stripped_line = line.strip()
-            
-            if stripped_line.startswith('//') or stripped_line.startswith('/*') or stripped_line.startswith('*'):
-                continue
-            
-            if not in_class and re.search(class_pattern, stripped_line):
-                class_start = line_num
-                in_class = True
-                brace_count = stripped_line.count('{') - stripped_line.count('}')
-            elif in_class:
-                brace_count += stripped_line.count('{')
-                brace_count -= stripped_line.count('}')
-            
-            if in_class and brace_count == 0:
-                boundaries = (class_start, line_num)
-                break
+    if lines is None:
+        lines = read_lines(file_path)
+        if lines is None:
+            return []
     
+    boundaries = find_class_boundaries(file_path, class_name, lines)
     if not boundaries:
         return []
     
+    return _extract_id_fields_in_class(lines, boundaries, validation_macros)
+
+
+def find_class_boundaries(file_path: str, class_name: str, lines: Optional[List[str]] = None) -> Optional[tuple]:
+    """
+    Find the start and end line numbers of a class definition.
+    
+    Args:
+        file_path: Path to the C++ file
+        class_name: Name of the class to find
+        lines: Optional already-read lines of the file (avoids reading it again)
+        
+    Returns:
+        Tuple of (start_line, end_line) or None if not found
+    """
+    if lines is None:
+        lines = read_lines(file_path)
+        if lines is None:
+            return None
+    
+    if HAS_SERIALIZATIONLIB:
+        return S2_extract_dto_fields.find_class_boundaries(file_path, class_name, lines)
+    # Fallback implementation
+    return _find_class_boundaries_in_lines(lines, class_name)
+
+
+def _extract_id_fields_in_class(lines: List[str], boundaries: tuple, validation_macros: Dict[str, str] = None) -> List[IdField]:
+    """Extract @Id fields from the class spanning boundaries (1-based, inclusive) of lines."""
     start_line, end_line = boundaries
     class_lines = lines[start_line - 1:end_line]
     
     # Discover validation macros if not provided
     if validation_macros is None:
-        if HAS_SERIALIZATIONLIB:
-            try:
-                validation_macros = S6_discover_validation_macros.find_validation_macro_definitions(None)
-            except:
-                validation_macros = {}
-        else:
-            validation_macros = {}
-    
-    # Build pattern for validation annotations
-    macro_names = list(validation_macros.keys()) if validation_macros else []
-    # Create annotation patterns (e.g., 'NotNull' -> '/* @NotNull */')
-    annotation_patterns = {}
-    for macro_name in macro_names:
-        annotation_patterns[macro_name] = rf'/\*\s*@{re.escape(macro_name)}\s*\*/'
-    
-    # Combined pattern to match any validation annotation
-    all_annotations = '|'.join(annotation_patterns.values()) if annotation_patterns else ''
-    validation_pattern = rf'({all_annotations})' if all_annotations else None
-    
-    # Pattern for /* @Id */ or /*@Id*/ annotation (ignoring whitespace)
-    # Also check for already processed /*--@Id--*/ pattern
-    id_annotation_pattern = r'/\*\s*@Id\s*\*/'
-    id_processed_pattern = r'/\*--\s*@Id\s*--\*/'
-    
-    # Pattern for field declaration
-    # Matches: "int rollNo;", "StdString name;", "const long digit;", etc.
-    field_pattern = r'^\s*(?:Public|Private|Protected)?\s*(?:const\s+)?([A-Za-z_][A-Za-z0-9_<>*&,\s]*?)\s+([A-Za-z_][A-Za-z0-9_]*)\s*[;=]'
+        validation_macros = _discover_validation_macros(*_validation_dirs())
     
-    result = []
-    i = 0
+    # Build one pattern for all validation annotations (e.g., 'NotNull' -> '/* @NotNull */').
+    # The macro name is captured, so a single search both detects and identifies it.
+    validation_re = _validation_pattern(frozenset(validation_macros)) if validation_macros else None
     
-    while i < len(class_lines):
-        line = class_lines[i]
-        stripped = line.strip()
-        
-        # Skip other comments that aren't @Id annotations
-        # But allow /* @Id */ annotations to be processed
-        if stripped.startswith('/*') and not re.search(id_annotation_pattern, stripped):
-            i += 1
-            continue
-        # Skip single-line comments
-        if stripped.startswith('//'):
-            i += 1
-            continue
+    return _scan_id_fields(class_lines, validation_re)
+
+
+@functools.lru_cache(maxsize=8)
+def _discover_validation_macros(project_dir: Optional[str], library_dir: Optional[str]) -> Dict[str, str]:
+    """
+    Discover validation macros once per (project_dir, library_dir).
+    
+    S6 scans every header of the project and library, which is far more work
+    than scanning one entity; the arguments mirror the environment variables
+    S6 reads and only serve as the cache key.
+    """
+    if not HAS_SERIALIZATIONLIB:
+        return {}
+    try:
+        return S6_discover_validation_macros.find_validation_macro_definitions(None)
+    except Exception as e:
+        return {}
+
+
+@functools.lru_cache(maxsize=32)
+def _validation_pattern(macro_names: frozenset):
+    """
+    Compile a single pattern matching any of the given validation annotations.
+    
+    Compiled once per set of macro names, so all files sharing the discovered
+    macros reuse it. Group 1 of a match is the macro name. Names are tried
+    longest first so that a macro whose name is a prefix of another one cannot
+    shadow it.
+    """
+    alternatives = '|'.join(re.escape(name) for name in sorted(macro_names, key=lambda name: (-len(name), name)))
+    return re.compile(rf'/\*\s*@({alternatives})\s*\*/')
+
+
+def _lines_containing(lines: List[str], needle: str) -> List[int]:
+    """
+    Return the indices of the lines containing needle, in increasing order.
+    
+    Searches the joined text with str.find, so the cost is one C-level scan of
+    the text plus work proportional to the number of hits, not to the number
+    of lines.
+    """
+    text = ''.join(lines)
+    indices = []
+    line_index = 0
+    last_pos = 0
+    pos = text.find(needle)
+    while pos != -1:
+        line_index += text.count('\n', last_pos, pos)
+        last_pos = pos
+        if not indices or indices[-1] != line_index:
+            indices.append(line_index)
+        pos = text.find(needle, pos + len(needle))
+    return indices
+
+
+# States of the @Id scanner
+_SEEK_ID = 0          # looking for the next /* @Id */ annotation
+_EXPECT_FIELD = 1     # after /* @Id */, collecting validation annotations until the field
+
+# Maximum number of lines between an /* @Id */ annotation and its field
+_ID_LOOKAHEAD_LINES = 15
+
+# Line kinds returned by _classify_line
+_LINE_BLANK = 0       # empty line
+_LINE_COMMENT = 1     # comment that is neither @Id nor a validation annotation
+_LINE_ID = 2          # /* @Id */ annotation
+_LINE_VALIDATION = 3  # validation annotation; payload is the macro name
+_LINE_FIELD = 4       # field declaration; payload is (type, name)
+_LINE_NOT_FIELD = 5   # declaration-like line that is not a field (e.g. a method)
+_LINE_STOP = 6        # access specifier or annotation/macro that ends the look-ahead
+_LINE_OTHER = 7       # anything else
+
+
+def _classify_line(stripped: str, validation_search) -> tuple:
+    """
+    Classify a stripped line of a class body for the @Id look-ahead.
+    
+    Uses substring and prefix tests; the validation pattern only runs on lines
+    containing '@' and the field parser only on lines containing ';' or '='.
+    
+    Args:
+        stripped: Line with surrounding whitespace removed
+        validation_search: search method of the validation annotation pattern, or None
         
-        # Skip empty lines
-        if not stripped:
-            i += 1
-            continue
+    Returns:
+        Tuple of (kind, payload) where kind is one of the _LINE_* constants
+    """
+    if not stripped:
+        return _LINE_BLANK, None
+    
+    # Annotations always contain '@'
+    has_at = '@' in stripped
+    
+    if stripped.startswith('/*'):
+        if has_at and _has_annotation(stripped, '@Id'):
+            return _LINE_ID, None
+        validation_match = validation_search(stripped) if (has_at and validation_search) else None
+        if validation_match:
+            return _LINE_VALIDATION, validation_match.group(1)
+        return _LINE_COMMENT, None
+    
+    if stripped.startswith('//'):
+        return _LINE_COMMENT, None
+    
+    validation_match = validation_search(stripped) if (has_at and validation_search) else None
+    if validation_match:
+        return _LINE_VALIDATION, validation_match.group(1)
+    
+    # Field declaration (needs a terminating ';' or '=')
+    field = _parse_field_declaration(stripped) if (';' in stripped or '=' in stripped) else None
+    if field:
+        # Skip if it looks like a method declaration
+        if '(' in stripped or ')' in stripped or field[1] in ('public', 'private', 'protected'):
+            return _LINE_NOT_FIELD, None
+        return _LINE_FIELD, field
+    
+    if (':' in stripped and _is_access_specifier(stripped)) or _is_stop_line(stripped):
+        return _LINE_STOP, None
+    
+    return _LINE_OTHER, None
+
+
+def _scan_id_fields(class_lines: List[str], validation_re) -> List[IdField]:
+    """
+    Collect @Id fields from the lines of a class body.
+    
+    Single pass over the lines with a two-state machine driven by
+    _classify_line: an @Id annotation switches to _EXPECT_FIELD, validation
+    annotations are accumulated, and the next field declaration is emitted.
+    Every line is stripped and classified at most once.
+    
+    Args:
+        class_lines: Lines of the class, from declaration to closing brace
+        validation_re: Compiled validation annotation pattern capturing the macro name, or None
         
-        # Check if line is already processed (/*--@Id--*/)
-        if re.search(id_processed_pattern, stripped):
-            i += 1
-            continue
+    Returns:
+        List of IdField records as returned by extract_id_fields
+    """
+    validation_search = validation_re.search if validation_re else None
+    # Type names ("int", "StdString", ...) repeat across many entities; intern them
+    intern = sys.intern
+    result = []
+    
+    # While seeking, jump straight from one line containing '@Id' to the next
+    # instead of visiting every line of the class body
+    candidates = _lines_containing(class_lines, '@Id')
+    if not candidates:
+        return result
+    n = len(class_lines)
+    
+    state = _SEEK_ID
+    id_line = 0
+    validation_macros_found = []
+    
+    i = -1
+    while True:
+        i += 1
+        if state == _SEEK_ID:
+            k = bisect.bisect_left(candidates, i)
+            if k == len(candidates):
+                break
+            i = candidates[k]
+        if i >= n:
+            break
+        line = class_lines[i]
         
-        # Check for @Id annotation (/* @Id */ or /*@Id*/)
-        id_match = re.search(id_annotation_pattern, stripped)
-        if id_match:
-            # Look ahead for field declaration (within next 15 lines, may have validation macros in between)
-            found_field = False
-            validation_macros_found = []
-            
-            for j in range(i + 1, min(i + 16, len(class_lines))):
-                next_line = class_lines[j].strip()
+        if state == _EXPECT_FIELD:
+            if i - id_line > _ID_LOOKAHEAD_LINES:
+                # No field close enough to the annotation; look for the next @Id
+                state = _SEEK_ID
+            else:
+                kind, payload = _classify_line(line.strip(), validation_search)
                 
-                # Skip other comments that aren't annotations
-                # But allow /* @Id */ and validation annotations to be processed
-                if next_line.startswith('/*') and not (re.search(id_annotation_pattern, next_line) or (validation_pattern and re.search(validation_pattern, next_line))):
+                if kind == _LINE_ID:
+                    # Repeated @Id for the same field: restart the window
+                    id_line = i
                     continue
-                # Skip single-line comments
-                if next_line.startswith('//'):
+                if kind == _LINE_VALIDATION:
+                    # Validation annotations can appear between @Id and field
+                    validation_macros_found.append(intern(payload))
                     continue
-                
-                # Skip empty lines
-                if not next_line:
+                if kind == _LINE_FIELD:
+                    result.append(IdField(intern(payload[0]), intern(payload[1]), validation_macros_found))
+                    state = _SEEK_ID
+                elif kind == _LINE_NOT_FIELD or kind == _LINE_STOP:
+                    state = _SEEK_ID
+                else:
+                    # Blank lines, other comments and unrelated lines are skipped
                     continue
                 
-                # Check for validation annotations (can appear between @Id and field)
-                if validation_pattern and re.search(validation_pattern, next_line):
-                    # Find which annotation was matched
-                    matched_annotation = None
-                    for macro_name, pattern in annotation_patterns.items():
-                        if re.search(pattern, next_line):
-                            matched_annotation = macro_name
-                            break
-                    if matched_annotation:
-                        validation_macros_found.append(matched_annotation)
+                # A line that ended the look-ahead may itself carry an @Id
+                if '@Id' not in line:
                     continue
-                
-                # Check for field declaration
-                field_match = re.search(field_pattern, next_line)
-                if field_match:
-                    field_type = field_match.group(1).strip()
-                    field_name = field_match.group(2).strip()
-                    
-                    # Skip if it looks like a method declaration
-                    if '(' not in next_line and ')' not in next_line and field_name not in ['public', 'private', 'protected']:
-                        field_info = {
-                            'type': field_type,
-                            'name': field_name
-                        }
-                        
-                        if validation_macros_found:
-                            field_info['validation_macros'] = validation_macros_found
-                        
-                        result.append(field_info)
-                        found_field = True
-                    break
-                
-                # Stop if we hit another annotation or access specifier
-                if next_line and (re.search(r'^\s*(public|private|protected)\s*:', next_line, re.IGNORECASE) or 
-                                 re.search(r'^\s*(Dto|Serializable|_Entity|COMPONENT|SCOPE|VALIDATE|///\s*@(Id|Entity|Serializable|NotNull|NotEmpty|NotBlank))\s*$', next_line)):
-                    # If we hit another @Id, that's okay, we'll process it in the next iteration
-                    if re.search(id_annotation_pattern, next_line):
-                        break
-                    # Otherwise, stop looking
-                    break
-            
-            i += 1
+        
+        # _SEEK_ID: cheap substring test first, only lines mentioning @Id can match
+        if '@Id' not in line:
             continue
         
-        i += 1
+        stripped = line.strip()
+        
+        # Skip single-line comments and already processed /*--@Id--*/ annotations
+        if stripped.startswith('//') or _has_annotation(stripped, '@Id', processed=True):
+            continue
+        
+        # Check for @Id annotation (/* @Id */ or /*@Id*/)
+        if _has_annotation(stripped, '@Id'):
+            state = _EXPECT_FIELD
+            id_line = i
+            validation_macros_found = []
     
     return result
 
@@ -327,10 +768,49 @@ def extract_id_fields_from_file(file_path: str, serializable_macro: str = "_Enti
         serializable_macro: Name of the macro (Serializable -> @Serializable, _Entity -> @Entity)
         
     Returns:
-        Dictionary with 'class_name', 'has_serializable', and 'id_fields' keys, or None if error
+        Dictionary with 'class_name', 'has_serializable', 'class_boundaries' and 'id_fields' keys, or None if error
+        ('class_boundaries' is None when the file has no @Id annotation)
     """
+    key = _cache_key(file_path, serializable_macro)
+    if key is not None and key in _RESULT_CACHE:
+        result = _RESULT_CACHE[key]
+    else:
+        result = _extract_id_fields_from_file(file_path, serializable_macro, key)
+        if key is not None:
+            _RESULT_CACHE[key] = result
+    # Hand out a copy so a caller that edits the result (e.g. appends to
+    # 'id_fields') cannot corrupt the cached entry; IdField records are read-only
+    return dict(result, id_fields=list(result['id_fields']))
+
+
+def _extract_id_fields_from_file(file_path: str, serializable_macro: str, key: Optional[tuple]) -> Dict[str, any]:
+    """Uncached implementation of extract_id_fields_from_file."""
+    # Most headers carry no annotation at all; reject them before decoding
+    annotation_name = annotation_name_for_macro(serializable_macro)
+    found = _file_contains(file_path, annotation_name.encode('ascii'), b'@Id')
+    if found is not None and not found[0]:
+        return {
+            'has_serializable': False,
+            'id_fields': []
+        }
+    # Without any @Id in the file there is nothing to extract past the class name
+    has_id = found is None or found[1]
+    
+    # Read the file once; the annotation check and the @Id scan share the lines
+    lines = read_lines(file_path)
+    if lines is None:
+        return {
+            'has_serializable': False,
+            'id_fields': []
+        }
+    
     # Check if file has @Serializable or @Entity annotation
-    dto_info = check_has_serializable_macro(file_path, serializable_macro)
+    if key is not None and key in _CHECK_CACHE:
+        dto_info = _CHECK_CACHE[key]
+    else:
+        dto_info = _check_has_serializable_macro(file_path, serializable_macro, lines)
+        if key is not None:
+            _CHECK_CACHE[key] = dto_info
     
     if not dto_info or not dto_info.get('has_dto'):
         return {
@@ -345,16 +825,68 @@ def extract_id_fields_from_file(file_path: str, serializable_macro: str = "_Enti
             'id_fields': []
         }
     
-    # Extract @Id fields
-    id_fields = extract_id_fields(file_path, class_name)
+    # Extract @Id fields; the class boundaries are returned too so callers
+    # that edit the class (e.g. primary key injection) need not search again
+    boundaries = find_class_boundaries(file_path, class_name, lines) if has_id else None
+    id_fields = _extract_id_fields_in_class(lines, boundaries) if boundaries else []
     
     return {
         'has_serializable': True,
         'class_name': class_name,
+        'class_boundaries': boundaries,
         'id_fields': id_fields
     }
 
 
+extract_id_fields_from_file.cache_clear = clear_caches
+
+
+def warmup(serializable_macro: str = "_Entity") -> None:
+    """
+    Do the one-time setup of a run up front.
+    
+    Discovers the validation macros of the current environment and compiles
+    the patterns every file needs, so a long-lived driver (e.g. a batch run)
+    can pay these costs once at startup instead of on its first header.
+    
+    Args:
+        serializable_macro: Name of the macro the driver will process
+    """
+    validation_macros = _discover_validation_macros(*_validation_dirs())
+    if validation_macros:
+        _validation_pattern(frozenset(validation_macros))
+    _needles_pattern((annotation_name_for_macro(serializable_macro).encode('ascii'), b'@Id'))
+
+
+def extract_id_fields_batch(file_paths: Iterable[str], serializable_macro: str = "_Entity", workers: Optional[int] = None) -> Dict[str, Dict[str, any]]:
+    """
+    Extract @Id fields from many files concurrently.
+    
+    Files are independent and the work is dominated by file I/O and regex
+    matching, so a thread pool overlaps the reads across headers.
+    
+    Args:
+        file_paths: Paths of the C++ files to scan
+        serializable_macro: Name of the macro (Serializable -> @Serializable, _Entity -> @Entity)
+        workers: Maximum number of worker threads (defaults to min(32, cpu_count * 4))
+        
+    Returns:
+        Dictionary mapping each file path to its extract_id_fields_from_file result
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    
+    file_paths = list(dict.fromkeys(file_paths))
+    if not file_paths:
+        return {}
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) * 4)
+    workers = max(1, min(workers, len(file_paths)))
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(lambda path: extract_id_fields_from_file(path, serializable_macro), file_paths)
+        return dict(zip(file_paths, results))
+
+
 def main():
     """Main function to handle command line arguments."""
     import argparse
@@ -375,15 +907,10 @@ def main():
     args = parser.parse_args()
     
     result = extract_id_fields_from_file(args.file_path, args.macro)
+    # Determine annotation name for display
+    annotation_name = annotation_name_for_macro(args.macro)
     
     if result and result.get('has_serializable'):
-        # Determine annotation name for display
-        if args.macro == "_Entity":
-            annotation_name = "@Entity"
-        elif args.macro == "Serializable":
-            annotation_name = "@Serializable"
-        else:
-            annotation_name = "@Serializable"
         # print(f"✅ Class '{result['class_name']}' has {annotation_name} annotation")
         id_fields = result.get('id_fields', [])
         # print(f"   Found {len(id_fields)} @Id field(s):")
@@ -394,22 +921,23 @@ def main():
         #     print(f"     {field['type']} {field['name']}{validation_info}")
         return 0
     else:
-        # Determine annotation name for display
-        if args.macro == "_Entity":
-            annotation_name = "@Entity"
-        elif args.macro == "Serializable":
-            annotation_name = "@Serializable"
-        else:
-            annotation_name = "@Serializable"
         # print(f"❌ No class with {annotation_name} annotation found, or no @Id fields found")
         return 1
 
 
 # Export functions for other scripts to import
 __all__ = [
+    'IdField',
+    'id_fields_to_dicts',
     'check_has_serializable_macro',
     'extract_id_fields',
+    'find_class_boundaries',
     'extract_id_fields_from_file',
+    'extract_id_fields_batch',
+    'clear_caches',
+    'warmup',
+    'read_lines',
+    'annotation_name_for_macro',
     'main'
 ]
 
@@ -8,80 +8,94 @@ import os
 from pathlib import Path
 
 
-def get_client_files(project_dir, file_extensions=None, skip_exclusions=False):
+# Directories to exclude (PlatformIO library and build directories)
+EXCLUDE_DIRS = frozenset({
+    '.pio',           # PlatformIO build and library directory
+    '.git',           # Git directory
+    'build',          # Build directory
+    '.vscode',        # VS Code settings (optional, but common)
+    '.idea',          # IDE settings
+})
+
+
+def iter_client_files(project_dir, file_extensions=None, skip_exclusions=False):
     """
-    Get all files in the client project, excluding library directories.
-    Optionally filter files by their extensions.
+    Yield the files in the client project, excluding library directories.
+    
+    Excluded directories are pruned and extensions are checked while walking,
+    so nothing outside the requested set is materialized.
     
     Args:
         project_dir: Path to the client project root (where platformio.ini is)
         file_extensions: Optional list of file extensions to filter by (e.g., ['.h', '.cpp'] or ['h', 'cpp']).
-                        If None or empty, returns all files. Extensions are case-insensitive.
+                        If None or empty, yields all files. Extensions are case-insensitive.
         skip_exclusions: If True, skip directory exclusion logic (useful for scanning library directories)
     
-    Returns:
-        List of full absolute file paths
+    Yields:
+        Full absolute file paths, in directory walk order
     """
-    project_path = Path(project_dir).resolve()
-    client_files = []
+    project_path = os.path.realpath(project_dir)
     
     # Normalize file extensions: ensure they start with '.' and are lowercase
     normalized_extensions = None
     if file_extensions:
-        normalized_extensions = []
+        normalized_extensions = set()
         for ext in file_extensions:
             ext_str = str(ext).lower()
             if not ext_str.startswith('.'):
                 ext_str = '.' + ext_str
-            normalized_extensions.append(ext_str)
+            normalized_extensions.add(ext_str)
     
-    # Directories to exclude (PlatformIO library and build directories)
-    exclude_dirs = {
-        '.pio',           # PlatformIO build and library directory
-        '.git',           # Git directory
-        'build',          # Build directory
-        '.vscode',        # VS Code settings (optional, but common)
-        '.idea',          # IDE settings
-    }
+    if not skip_exclusions and not EXCLUDE_DIRS.isdisjoint(Path(project_path).parts):
+        # The project itself lies inside an excluded directory
+        return
     
-    # Walk through the project directory
-    for root, dirs, files in os.walk(project_path):
-        # Convert to Path for easier manipulation
-        root_path = Path(root)
-        
-        # Skip exclusion logic if skip_exclusions is True
-        if not skip_exclusions:
-            # Skip if this directory or any parent is in exclude_dirs
-            should_skip = False
-            for part in root_path.parts:
-                if part in exclude_dirs:
-                    should_skip = True
-                    break
-            
-            if should_skip:
-                # Remove excluded directories from dirs list to prevent walking into them
-                dirs[:] = [d for d in dirs if d not in exclude_dirs]
-                continue
-        
-        # Add files in this directory (with optional extension filtering)
-        for file in files:
-            file_path = root_path / file
-            
-            # Filter by extension if extensions are provided
-            if normalized_extensions:
-                file_ext = file_path.suffix.lower()
-                if file_ext not in normalized_extensions:
+    pending = [project_path]
+    while pending:
+        directory = pending.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        # Symlinked directories are listed but not followed (like os.walk)
+                        if (skip_exclusions or entry.name not in EXCLUDE_DIRS) and not entry.is_symlink():
+                            pending.append(entry.path)
+                        continue
+                except OSError:
+                    pass
+                
+                # Filter by extension if extensions are provided
+                if normalized_extensions and os.path.splitext(entry.name)[1].lower() not in normalized_extensions:
+                    continue
+                
+                # Get full absolute path; directories are only entered through real paths,
+                # so only a symlinked file itself needs resolving
+                try:
+                    yield os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                except (ValueError, OSError):
+                    # Skip if path cannot be resolved
                     continue
-            
-            # Get full absolute path
-            try:
-                full_path = file_path.resolve()
-                client_files.append(str(full_path))
-            except (ValueError, OSError):
-                # Skip if path cannot be resolved
-                continue
+
+
+def get_client_files(project_dir, file_extensions=None, skip_exclusions=False):
+    """
+    Get all files in the client project, excluding library directories.
+    Optionally filter files by their extensions.
+    
+    Args:
+        project_dir: Path to the client project root (where platformio.ini is)
+        file_extensions: Optional list of file extensions to filter by (e.g., ['.h', '.cpp'] or ['h', 'cpp']).
+                        If None or empty, returns all files. Extensions are case-insensitive.
+        skip_exclusions: If True, skip directory exclusion logic (useful for scanning library directories)
     
-    return sorted(client_files)
+    Returns:
+        List of full absolute file paths
+    """
+    return sorted(iter_client_files(project_dir, file_extensions, skip_exclusions))
 
 
 if __name__ == "__main__":
@@ -94,6 +108,5 @@ if __name__ == "__main__":
         project_dir = os.getcwd()
     
     files = get_client_files(project_dir)
-    for f in files:
-        pass
+    # print("\n".join(files))
 
@@ -6,6 +6,9 @@ This script uses extract_id_fields to find @Id fields in a class,
 and injects GetPrimaryKey() and GetPrimaryKeyName() methods at the end of the class.
 """
 
+import functools
+import itertools
+import operator
 import re
 import sys
 import os
@@ -22,61 +25,115 @@ sys.path.insert(0, script_dir)
 
 # Import extract_id_fields
 try:
-    from springbootplusplus_data_core.extract_id_fields import extract_id_fields_from_file, extract_id_fields
+    from springbootplusplus_data_core.extract_id_fields import extract_id_fields_from_file, extract_id_fields, annotation_name_for_macro, read_lines, warmup
     HAS_EXTRACT_ID = True
 except ImportError as e:
     # print(f"Warning: Could not import extract_id_fields: {e}")
     HAS_EXTRACT_ID = False
 
 
-def find_class_boundaries(file_path: str, class_name: str) -> Optional[tuple]:
+# Prefixes of comment lines skipped by the class scans
+_COMMENT_PREFIXES = ('//', '/*', '*')
+_LINE_COMMENT_PREFIXES = ('//', '/*')
+
+# Leading whitespace of a line (indentation of the class closing brace)
+_INDENT_RE = re.compile(r'^(\s*)')
+
+
+@functools.lru_cache(maxsize=128)
+def _class_regex(class_name: str):
+    """Return the compiled pattern matching the declaration of class_name."""
+    return re.compile(rf'class\s+{re.escape(class_name)}\b')
+
+
+def _read_file_lines(file_path: str) -> Optional[List[str]]:
+    """Read the lines of a file, reusing extract_id_fields' read of an unchanged file when available."""
+    if HAS_EXTRACT_ID:
+        # Shared read-only tuple; the lines are never modified in place
+        return read_lines(file_path)
+    try:
+        with open(file_path, 'r', encoding='utf-8') as file:
+            return file.readlines()
+    except Exception as e:
+        # print(f"Error reading file: {e}")
+        return None
+
+
+def find_class_boundaries(file_path: str, class_name: str, lines: Optional[List[str]] = None) -> Optional[tuple]:
     """
     Find the start and end line numbers of a class definition.
     
     Args:
         file_path: Path to the C++ file
         class_name: Name of the class to find
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
         Tuple of (start_line, end_line) or None if not found
     """
+    if lines is not None:
+        return _scan_class_boundaries(lines, class_name)
+    
+    # Stream the file so reading stops as soon as the class is closed
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
+            return _scan_class_boundaries(file, class_name)
     except Exception as e:
         # print(f"Error reading file: {e}")
         return None
+
+
+def _scan_class_boundaries(lines, class_name: str) -> Optional[tuple]:
+    """
+    Find the class boundaries in an iterable of lines, stopping at the closing brace.
     
-    class_start = None
-    brace_count = 0
-    in_class = False
-    
-    class_pattern = rf'class\s+{re.escape(class_name)}'
-    
-    for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
+    Args:
+        lines: Iterable of lines (a list or an open file)
+        class_name: Name of the class to find
+        
+    Returns:
+        Tuple of (start_line, end_line) or None if not found
+    """
+    class_re = _class_regex(class_name)
+    line_iter = iter(lines)
+    
+    # Locate the class declaration
+    for line_num, line in enumerate(line_iter, 1):
+        # Only leading whitespace matters for the comment test; braces are counted
+        # on the same text, so the trailing side need not be stripped
+        stripped_line = line.lstrip()
         
         # Skip commented lines
-        if stripped_line.startswith('//') or stripped_line.startswith('/*') or stripped_line.startswith('*'):
+        if stripped_line.startswith(_COMMENT_PREFIXES):
             continue
         
-        # Check for class declaration
-        if not in_class and re.search(class_pattern, stripped_line):
+        if class_name in stripped_line and class_re.search(stripped_line):
             class_start = line_num
-            in_class = True
             # Initialize brace count from this line
             brace_count = stripped_line.count('{') - stripped_line.count('}')
-        elif in_class:
-            # Count braces for subsequent lines
-            brace_count += stripped_line.count('{')
-            brace_count -= stripped_line.count('}')
-        
-        if in_class:
-            # If braces are balanced and we've closed the class, we're done
-            if brace_count == 0:
-                return (class_start, line_num)
+            break
+    else:
+        return None
     
-    return None
+    if brace_count == 0:
+        return (class_start, class_start)
+    
+    # Running brace depth over the following lines (a cumulative sum of the
+    # per-line net brace counts); the class ends where the depth returns to 0
+    depths = itertools.accumulate(map(_net_braces, line_iter), initial=brace_count)
+    try:
+        offset = operator.indexOf(depths, 0)
+    except ValueError:
+        return None
+    return (class_start, class_start + offset)
+
+
+def _net_braces(line: str) -> int:
+    """Return '{' count minus '}' count of a line, or 0 for comment lines."""
+    stripped_line = line.lstrip()
+    if stripped_line.startswith(_COMMENT_PREFIXES):
+        return 0
+    return stripped_line.count('{') - stripped_line.count('}')
 
 
 def generate_primary_key_methods(field_type: str, field_name: str, class_name: str) -> str:
@@ -113,7 +170,7 @@ def generate_primary_key_methods(field_type: str, field_name: str, class_name: s
     return "\n".join(methods)
 
 
-def inject_primary_key_methods(file_path: str, class_name: str, field_type: str, field_name: str, dry_run: bool = False) -> bool:
+def inject_primary_key_methods(file_path: str, class_name: str, field_type: str, field_name: str, dry_run: bool = False, boundaries: Optional[tuple] = None) -> bool:
     """
     Inject GetPrimaryKey() and GetPrimaryKeyName() methods at the end of a class.
     
@@ -123,19 +180,18 @@ def inject_primary_key_methods(file_path: str, class_name: str, field_type: str,
         field_type: Type of the primary key field
         field_name: Name of the primary key field
         dry_run: If True, don't actually modify the file
+        boundaries: Optional (start_line, end_line) of the class, if already known
         
     Returns:
         True if successful, False otherwise
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except Exception as e:
-        # print(f"Error reading file: {e}")
+    lines = _read_file_lines(file_path)
+    if lines is None:
         return False
     
     # Find class boundaries
-    boundaries = find_class_boundaries(file_path, class_name)
+    if boundaries is None:
+        boundaries = find_class_boundaries(file_path, class_name, lines)
     if not boundaries:
         # print(f"Error: Could not find class boundaries for {class_name}")
         return False
@@ -160,7 +216,7 @@ def inject_primary_key_methods(file_path: str, class_name: str, field_type: str,
     # Find the indentation of the closing brace
     closing_line = lines[closing_line_idx]
     # Get indentation from the closing brace line
-    indent_match = re.match(r'^(\s*)', closing_line)
+    indent_match = _INDENT_RE.match(closing_line)
     indent = indent_match.group(1) if indent_match else "    "
     
     # Add proper indentation to methods
@@ -188,26 +244,35 @@ def inject_primary_key_methods(file_path: str, class_name: str, field_type: str,
     for i in range(closing_line_idx - 1, start_line - 2, -1):
         stripped = lines[i].strip()
         # Skip empty lines and comments
-        if stripped and not stripped.startswith('//') and not stripped.startswith('/*'):
+        if stripped and not stripped.startswith(_LINE_COMMENT_PREFIXES):
             insert_position = i + 1
             break
     
-    # Ensure we have a newline before the methods
-    methods_code = '\n' + methods_code
-    
-    # Convert methods_code to list of lines with newlines
-    methods_lines = []
-    for line in methods_code.split('\n'):
-        methods_lines.append(line + '\n')
+    # Ensure we have a newline before the methods, and end them with one
+    methods_code = '\n' + methods_code + '\n'
     
-    # Insert the methods
-    lines[insert_position:insert_position] = methods_lines
+    # Build the new content around the insertion point instead of inserting
+    # into the line list (which would shift every following line)
+    head = ''.join(lines[:insert_position])
+    tail = ''.join(lines[insert_position:])
     
     # Write back to file
+    if not _write_file(file_path, head + methods_code + tail):
+        return False
+    # print(f"✓ Injected GetPrimaryKey() methods into {class_name} in {file_path}")
+    return True
+
+
+def _write_file(file_path: str, content: str) -> bool:
+    """
+    Write content to a file with a single write() call.
+    
+    Returns:
+        True if the file holds content afterwards, False if writing failed
+    """
     try:
         with open(file_path, 'w', encoding='utf-8') as file:
-            file.writelines(lines)
-        # print(f"✓ Injected GetPrimaryKey() methods into {class_name} in {file_path}")
+            file.write(content)
         return True
     except Exception as e:
         # print(f"Error writing file: {e}")
@@ -235,12 +300,7 @@ def process_file(file_path: str, serializable_macro: str = "_Entity", dry_run: b
     
     if not result or not result.get('has_serializable'):
         # Determine annotation name for display
-        if serializable_macro == "_Entity":
-            annotation_name = "@Entity"
-        elif serializable_macro == "Serializable":
-            annotation_name = "@Serializable"
-        else:
-            annotation_name = "@Serializable"
+        annotation_name = annotation_name_for_macro(serializable_macro)
         # print(f"File {file_path} does not have {annotation_name} annotation, skipping")
         return False
     
@@ -260,7 +320,67 @@ def process_file(file_path: str, serializable_macro: str = "_Entity", dry_run: b
     # print(f"Found primary key field in {class_name}: {field_type} {field_name}")
     
     # Inject the methods
-    return inject_primary_key_methods(file_path, class_name, field_type, field_name, dry_run)
+    return inject_primary_key_methods(file_path, class_name, field_type, field_name, dry_run, result.get('class_boundaries'))
+
+
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 5
+
+
+def _process_one(job: tuple) -> bool:
+    """Run process_file on a (file_path, serializable_macro, dry_run) job in a worker process."""
+    file_path, serializable_macro, dry_run = job
+    return process_file(file_path, serializable_macro, dry_run)
+
+
+def process_files(file_paths: List[str], serializable_macro: str = "_Entity", dry_run: bool = False, workers: Optional[int] = 1, mp_context=None) -> Dict[str, bool]:
+    """
+    Process many files, optionally in parallel worker processes.
+    
+    By default every file is processed in this interpreter, sharing compiled
+    patterns and caches. Files are independent and parsing them is CPU-bound,
+    so a caller can opt in to a process pool with workers other than 1; it is
+    only used when the batch is large enough.
+    
+    With the "spawn" start method (the default on Windows and macOS) each worker
+    re-imports the calling program's __main__ module. Only opt in from a program
+    whose top-level code is guarded by if __name__ == "__main__", or pass an
+    mp_context such as multiprocessing.get_context("fork") where available.
+    
+    Args:
+        file_paths: Paths to the C++ files
+        serializable_macro: Name of the macro (Serializable -> @Serializable, _Entity -> @Entity)
+        dry_run: If True, don't actually modify the files
+        workers: Maximum number of worker processes (default 1, no pool; None uses the number of CPUs)
+        mp_context: Optional multiprocessing context for the pool (e.g. multiprocessing.get_context("fork"))
+        
+    Returns:
+        Dictionary mapping each file path to the result of process_file
+    """
+    # Each file is processed once even if it is listed several times
+    unique_paths = list(dict.fromkeys(file_paths))
+    
+    if HAS_EXTRACT_ID and len(unique_paths) >= _PARALLEL_MIN_FILES and workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        jobs = [(file_path, serializable_macro, dry_run) for file_path in unique_paths]
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=mp_context) as executor:
+            return dict(zip(unique_paths, executor.map(_process_one, jobs, chunksize=8)))
+    
+    if HAS_EXTRACT_ID and len(unique_paths) > 1:
+        # Discover validation macros and compile shared patterns once up front
+        warmup(serializable_macro)
+    return {file_path: process_file(file_path, serializable_macro, dry_run) for file_path in unique_paths}
+
+
+def _read_file_list(list_path: str) -> List[str]:
+    """Read file paths, one per line, from a file ('-' reads standard input)."""
+    if list_path == '-':
+        content = sys.stdin.read()
+    else:
+        with open(list_path, 'r', encoding='utf-8') as file:
+            content = file.read()
+    return [line.strip() for line in content.splitlines() if line.strip()]
 
 
 def main():
@@ -271,8 +391,13 @@ def main():
         description="Inject GetPrimaryKey() methods into classes with @Id fields"
     )
     parser.add_argument(
-        "file_path",
-        help="Path to the C++ file"
+        "file_paths",
+        nargs="*",
+        help="Paths to the C++ files"
+    )
+    parser.add_argument(
+        "--files-from",
+        help="File with one C++ file path per line ('-' for standard input)"
     )
     parser.add_argument(
         "--macro",
@@ -284,12 +409,25 @@ def main():
         action="store_true",
         help="Show what would be changed without making changes"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes for large batches (default: number of CPUs)"
+    )
     
     args = parser.parse_args()
     
-    success = process_file(args.file_path, args.macro, args.dry_run)
+    file_paths = list(args.file_paths)
+    if args.files_from:
+        file_paths.extend(_read_file_list(args.files_from))
+    if not file_paths:
+        parser.error("no input files given")
+    
+    # Run as a script, so the pool's workers can safely re-import this module
+    results = process_files(file_paths, args.macro, args.dry_run, workers=args.jobs)
     
-    return 0 if success else 1
+    return 0 if all(results.values()) else 1
 
 
 # Export functions for other scripts to import
@@ -297,6 +435,7 @@ __all__ = [
     'generate_primary_key_methods',
     'inject_primary_key_methods',
     'process_file',
+    'process_files',
     'main'
 ]
 
@@ -22,34 +22,65 @@ Detects patterns:
 Returns: class_name, template_param1, template_param2
 """
 
+import functools
+import mmap
+import os
 import re
 import sys
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
+
+
+# Patterns compiled once at import; detect_repository runs on every source file
+# // and /* */ comments in one alternation, so the text is scanned once
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+# /// @Repository or ///@Repository annotation (ignoring whitespace)
+_REPOSITORY_ANNOTATION_RE = re.compile(r'///\s*@Repository\b')
+# Already processed /* @Repository */ annotation
+_PROCESSED_ANNOTATION_RE = re.compile(r'/\*\s*@Repository\s*\*/')
+_DEFINE_STANDARD_POINTERS_RE = re.compile(r'DefineStandardPointers\s*\(\s*(\w+)\s*\)')
+# The three markers detect_repository looks for in the raw content, in one
+# alternation so a single sweep finds all of them
+_REPOSITORY_MARKERS_RE = re.compile(
+    r'(?P<annotation>///\s*@Repository\b)'
+    r'|(?P<processed>/\*\s*@Repository\s*\*/)'
+    r'|DefineStandardPointers\s*\(\s*(?P<class_name>\w+)\s*\)'
+)
+# class ClassName (optional final) : public (optional virtual) CpaRepository<Type1, Type2>
+# for any class name; group 1 is the class name, so one compiled pattern serves every class
+_CPA_REPOSITORY_RE = re.compile(r'class\s+(\w+)\s+(?:final\s+)?:\s*public\s+(?:virtual\s+)?CpaRepository\s*<\s*([^,<>]+)\s*,\s*([^,<>]+)\s*>')
+
+
+@functools.lru_cache(maxsize=1024)
+def _template_class_pattern(class_name: str):
+    """Return the compiled template<...> class ClassName pattern for class_name."""
+    return re.compile(rf'template\s*<\s*[^>]+\s*>\s*class\s+{re.escape(class_name)}')
 
 
 def remove_comments(content: str) -> str:
     """Remove both // and /* */ style comments."""
-    # Remove single-line comments
-    content = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-    
-    # Remove multi-line comments
-    content = re.sub(r'/\*.*?\*/', '', content, flags=re.DOTALL)
+    # Nothing to remove: skip the regex sweep (and the copy it makes)
+    if '//' not in content and '/*' not in content:
+        return content
     
-    return content
+    # Whichever comment starts first wins, so a // inside /* */ (or the
+    # reverse) is removed together with the comment that contains it
+    return _COMMENT_RE.sub('', content)
 
 
 def find_repository_annotation(content: str) -> bool:
     """Check if @Repository annotation is present (not processed)."""
+    # Most files never mention the annotation; a substring test rejects them
+    # before any regex runs
+    if '@Repository' not in content:
+        return False
+    
     # Look for /// @Repository or ///@Repository annotation (ignoring whitespace)
     # Also check for already processed /* @Repository */ pattern
-    # Pattern matches: /// followed by optional whitespace, then @Repository
-    pattern = r'///\s*@Repository\b'
     
     # Check if annotation exists and is not already processed
-    if re.search(pattern, content):
+    if _REPOSITORY_ANNOTATION_RE.search(content):
         # Check if it's already processed (/* @Repository */)
-        processed_pattern = r'/\*\s*@Repository\s*\*/'
-        if re.search(processed_pattern, content):
+        if _PROCESSED_ANNOTATION_RE.search(content):
             # Already processed, don't treat as found
             return False
         return True
@@ -57,10 +88,39 @@ def find_repository_annotation(content: str) -> bool:
     return False
 
 
+def _scan_repository_markers(content: str) -> Tuple[bool, Optional[str]]:
+    """
+    Find the @Repository annotation and the DefineStandardPointers class name in one pass.
+    
+    Equivalent to find_repository_annotation followed by
+    extract_class_name_from_define_standard_pointers, but sweeps the content
+    once instead of running each pattern over it separately.
+    
+    Returns:
+        Tuple of (annotation_found, class_name); annotation_found is False if the
+        annotation is missing or already processed, class_name is None if absent
+    """
+    has_annotation = False
+    class_name = None
+    for match in _REPOSITORY_MARKERS_RE.finditer(content):
+        if match.group('processed') is not None:
+            # Already processed, don't treat as found
+            return False, class_name
+        if match.group('annotation') is not None:
+            has_annotation = True
+        elif class_name is None:
+            class_name = match.group('class_name')
+    return has_annotation, class_name
+
+
+def find_processed_repository_annotation(content: str) -> bool:
+    """Check if an already processed /* @Repository */ annotation is present."""
+    return '@Repository' in content and bool(_PROCESSED_ANNOTATION_RE.search(content))
+
+
 def extract_class_name_from_define_standard_pointers(content: str) -> Optional[str]:
     """Extract class name from DefineStandardPointers(ClassName)."""
-    pattern = r'DefineStandardPointers\s*\(\s*(\w+)\s*\)'
-    match = re.search(pattern, content)
+    match = _DEFINE_STANDARD_POINTERS_RE.search(content)
     if match:
         return match.group(1)
     return None
@@ -68,60 +128,118 @@ def extract_class_name_from_define_standard_pointers(content: str) -> Optional[s
 
 def extract_cpaRepository_info(content: str, class_name: str) -> Optional[Tuple[str, str]]:
     """Extract template parameters from CpaRepository<Type1, Type2>."""
+    # The declaration cannot match without the literal; skip the regex then
+    if 'CpaRepository' not in content:
+        return None
+    
     # Pattern to match: class ClassName (optional final) : public (optional virtual) CpaRepository<Type1, Type2>
     # Handle both with and without 'final' keyword
     # Handle both with and without 'virtual' keyword
-    pattern = rf'class\s+{re.escape(class_name)}\s+(?:final\s+)?:\s*public\s+(?:virtual\s+)?CpaRepository\s*<\s*([^,<>]+)\s*,\s*([^,<>]+)\s*>'
-    
-    match = re.search(pattern, content)
-    if match:
-        type1 = match.group(1).strip()
-        type2 = match.group(2).strip()
-        return (type1, type2)
+    for match in _CPA_REPOSITORY_RE.finditer(content):
+        if match.group(1) == class_name:
+            type1 = match.group(2).strip()
+            type2 = match.group(3).strip()
+            return (type1, type2)
     return None
 
 
 def is_class_templated(content: str, class_name: str) -> bool:
     """Check if the repository class is templated."""
     # Remove comments for pattern matching
-    content_no_comments = remove_comments(content)
-    
+    return _is_class_templated_in(remove_comments(content), class_name)
+
+
+def _is_class_templated_in(content_no_comments: str, class_name: str) -> bool:
+    """is_class_templated on content whose comments were already removed."""
     # Look for template<typename ...> before the class declaration
     # Pattern: template<typename Entity, typename ID> class ClassName
-    pattern = rf'template\s*<\s*[^>]+\s*>\s*class\s+{re.escape(class_name)}'
-    return bool(re.search(pattern, content_no_comments))
+    return bool(_template_class_pattern(class_name).search(content_no_comments))
+
+
+# Per-run memoization of detect_repository, keyed by (abspath, mtime_ns, size)
+# so a file that gets rewritten (e.g. when its annotation is processed) is
+# detected again
+_DETECT_CACHE: Dict[tuple, Optional[Tuple[str, str, str, bool]]] = {}
+
+
+def clear_cache() -> None:
+    """Drop all memoized detect_repository results."""
+    _DETECT_CACHE.clear()
 
 
 def detect_repository(file_path: str) -> Optional[Tuple[str, str, str, bool]]:
     """
     Detect @Repository annotation and extract class information.
     
+    Results are memoized per file revision, so unchanged files are neither
+    read nor scanned again within a run.
+    
     Returns: (class_name, template_param1, template_param2, is_templated) or None
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    key = (os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
+    if key in _DETECT_CACHE:
+        return _DETECT_CACHE[key]
+    
+    result = _detect_repository(file_path)
+    _DETECT_CACHE[key] = result
+    return result
+
+
+def _detect_repository(file_path: str) -> Optional[Tuple[str, str, str, bool]]:
+    """Uncached implementation of detect_repository."""
+    try:
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            # Search the raw bytes first; most files never mention the annotation
+            # and are rejected without being decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm.find(b'@Repository') == -1:
+                    return None
+                content = mm[:].decode('utf-8')
+        # Same newline handling as reading in text mode
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
     except Exception as e:
         # print(f"Error reading file {file_path}: {e}", file=sys.stderr)
         return None
     
-    # Check if @Repository annotation is present (not processed)
-    annotation_found = find_repository_annotation(content)
+    # Most files never mention the annotation; a substring test rejects them
+    # before any regex runs. The CpaRepository pattern below needs its literal too.
+    if '@Repository' not in content or 'CpaRepository' not in content:
+        return None
+    
+    # Check if @Repository annotation is present (not processed) and extract
+    # the class name from DefineStandardPointers, in one sweep
+    annotation_found, class_name = _scan_repository_markers(content)
     
     if not annotation_found:
         return None
-    
-    # Extract class name from DefineStandardPointers
-    class_name = extract_class_name_from_define_standard_pointers(content)
     if not class_name:
         return None
     
-    # Check if class is templated
-    is_templated = is_class_templated(content, class_name)
+    return extract_repository_info(content, class_name)
+
+
+def extract_repository_info(content: str, class_name: str) -> Optional[Tuple[str, str, str, bool]]:
+    """
+    Extract the repository information of class_name from file content.
     
-    # Remove comments for class pattern matching (to avoid issues with commented code)
+    Shared by detect_repository and by callers that re-derive the information
+    of a repository whose annotation was already processed.
+    
+    Returns: (class_name, template_param1, template_param2, is_templated) or None
+    """
+    # Remove comments once for class pattern matching (to avoid issues with commented code)
     content_no_comments = remove_comments(content)
     
+    # Check if class is templated
+    is_templated = _is_class_templated_in(content_no_comments, class_name)
+    
     # Extract CpaRepository template parameters
     template_params = extract_cpaRepository_info(content_no_comments, class_name)
     if not template_params:
@@ -19,9 +19,12 @@ Examples:
 
 Usage:
     python extract_findby_variable_name.py <method_name_or_declaration>
+    python extract_findby_variable_name.py --batch < method_names.txt
     
 Returns:
-    The extracted variable name in camelCase, or None if not a FindBy method
+    The extracted variable name in camelCase, or None if not a FindBy method.
+    With --batch, one input is read per line from stdin and one line is written
+    per input (empty when it is not a FindBy method).
 """
 
 import re
@@ -29,6 +32,14 @@ import sys
 from typing import Optional
 
 
+# Method declaration: [Access] [Virtual/Static] ReturnType MethodName(parameters) [= 0];
+# (compiled once, as the generator calls this for every repository method)
+_METHOD_DECLARATION_RE = re.compile(r'(?:Public|Private|Protected|Virtual)?\s*(?:Virtual\s+|Static\s+)?[A-Za-z_][A-Za-z0-9_<>:&*,\s]+\s+([A-Za-z_][A-Za-z0-9_]*)\s*\(')
+
+# Prefix of FindBy method names, compared case-insensitively (FindByLastName, findByName, ...)
+_FINDBY_PREFIX = "findby"
+
+
 def pascal_to_camel(pascal_case: str) -> str:
     """
     Convert PascalCase to camelCase.
@@ -78,8 +89,7 @@ def extract_method_name_from_declaration(method_declaration: str) -> Optional[st
     # ([A-Za-z_][A-Za-z0-9_]*)                 - Method name (captured)
     # \s*\(                                     - Opening parenthesis
     
-    pattern = r'(?:Public|Private|Protected|Virtual)?\s*(?:Virtual\s+|Static\s+)?[A-Za-z_][A-Za-z0-9_<>:&*,\s]+\s+([A-Za-z_][A-Za-z0-9_]*)\s*\('
-    match = re.search(pattern, method_declaration)
+    match = _METHOD_DECLARATION_RE.search(method_declaration)
     
     if match:
         return match.group(1)
@@ -108,16 +118,15 @@ def extract_findby_variable_name(method_input: str) -> Optional[str]:
     if not method_name:
         method_name = method_input.strip()
     
-    # Pattern to match FindBy methods (case-insensitive)
-    # Matches: FindBy, FindByLastName, FindByName, etc.
-    pattern = r'^FindBy(.+)$'
-    match = re.match(pattern, method_name, re.IGNORECASE)
-    
-    if not match:
+    # Match FindBy methods (case-insensitive); a plain prefix check is enough here
+    prefix_length = len(_FINDBY_PREFIX)
+    if method_name[:prefix_length].lower() != _FINDBY_PREFIX:
         return None
     
-    # Extract the part after "FindBy"
-    pascal_case_part = match.group(1)
+    # Extract the part after "FindBy" (must be non-empty and on a single line)
+    pascal_case_part = method_name[prefix_length:]
+    if not pascal_case_part or '\n' in pascal_case_part:
+        return None
     
     # Convert to camelCase
     camel_case = pascal_to_camel(pascal_case_part)
@@ -129,8 +138,16 @@ def main():
     """Main function to handle command line arguments."""
     if len(sys.argv) < 2:
         print("Usage: python extract_findby_variable_name.py <method_name_or_declaration>", file=sys.stderr)
+        print("       python extract_findby_variable_name.py --batch < method_names.txt", file=sys.stderr)
         sys.exit(1)
     
+    if sys.argv[1] == '--batch':
+        # Many names through one interpreter instead of one process per method
+        for line in sys.stdin:
+            variable_name = extract_findby_variable_name(line.rstrip('\r\n'))
+            sys.stdout.write((variable_name or '') + '\n')
+        sys.exit(0)
+    
     method_input = sys.argv[1]
     variable_name = extract_findby_variable_name(method_input)
     
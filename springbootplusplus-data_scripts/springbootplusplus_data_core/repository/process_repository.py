@@ -10,18 +10,52 @@ This script:
    (just before the last #endif, or at the end if no #endif exists)
 """
 
+import functools
 import os
 import sys
 import re
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterator, List, Optional
 
-# Add parent directory to path for imports
+# Add this directory and springbootplusplus_data_core (for build_cache) to path for imports
 script_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, str(script_dir))
+core_dir = os.path.dirname(script_dir)
+if core_dir not in sys.path:
+    sys.path.insert(0, core_dir)
 
-from detect_repository import detect_repository
+from detect_repository import (
+    detect_repository,
+    extract_class_name_from_define_standard_pointers,
+    extract_repository_info,
+    find_processed_repository_annotation,
+)
 from implement_repository import implement_repository, generate_impl_class
+from build_cache import file_signature, load_manifest, save_manifest, write_content as _write_content
+
+
+# A whole "#endif" line, optionally followed by a comment: #endif, #endif // comment, #endif/*comment*/
+# ([^\S\n] is whitespace other than a newline, so a match never spans lines)
+_ENDIF_LINE_RE = re.compile(r'^[^\S\n]*#endif[^\S\n]*(//[^\n]*|/\*[^\n]*\*/)?[^\S\n]*$', re.MULTILINE)
+
+# The last #endif is almost always near the end; search this much of the tail first
+_ENDIF_TAIL_CHARS = 4096
+
+
+# A whole "/// @Repository" line and a whole processed "/* @Repository */" line
+# ([^\S\n] is whitespace other than a newline, so a match never spans lines)
+_REPOSITORY_ANNOTATION_LINE_RE = re.compile(r'^([^\S\n]*)///[^\S\n]*@Repository[^\S\n]*$', re.MULTILINE)
+_PROCESSED_ANNOTATION_LINE_RE = re.compile(r'^[^\S\n]*/\*[^\S\n]*@Repository[^\S\n]*\*/[^\S\n]*$', re.MULTILINE)
+
+
+def _processed_annotation_line(match) -> str:
+    """Build the processed marker for an annotation line, keeping space indentation."""
+    indent = match.group(1)
+    if indent.startswith(' '):
+        # Has indentation, preserve its width
+        return ' ' * len(indent) + '/* @Repository */'
+    # No indentation
+    return '/* @Repository */'
 
 
 def find_last_endif_position(content: str) -> Optional[int]:
@@ -34,19 +68,144 @@ def find_last_endif_position(content: str) -> Optional[int]:
     Returns:
         Line number (1-based) of the last #endif, or None if not found
     """
-    lines = content.split('\n')
-    last_endif_line = None
+    offset = _find_last_endif_offset(content)
+    if offset is None:
+        return None
+    return content.count('\n', 0, offset) + 1
+
+
+def _find_last_endif_offset(content: str) -> Optional[int]:
+    """
+    Find the offset of the start of the line holding the last #endif.
     
-    # Search from the end
-    for i in range(len(lines) - 1, -1, -1):
-        line = lines[i].strip()
-        # Check for #endif (with optional comment after it)
-        # Match patterns like: #endif, #endif // comment, #endif/*comment*/
-        if re.match(r'^\s*#endif\s*(//.*|/\*.*\*/)?\s*$', line):
-            last_endif_line = i + 1  # 1-based line number
-            break
+    Only the tail of the content is searched first; the rest is searched only
+    if the tail contains no #endif line.
     
-    return last_endif_line
+    Args:
+        content: File content as string
+        
+    Returns:
+        Offset into content of the last #endif line, or None if not found
+    """
+    # The regex needs the literal; without it there is nothing to search
+    last_literal = content.rfind('#endif')
+    if last_literal == -1:
+        return None
+    
+    # Common case: the last "#endif" in the text is a valid #endif line, and no
+    # later line can be one, so checking that single line is enough
+    line_start = content.rfind('\n', 0, last_literal) + 1
+    line_end = content.find('\n', last_literal)
+    if line_end == -1:
+        line_end = len(content)
+    if _ENDIF_LINE_RE.fullmatch(content, line_start, line_end):
+        return line_start
+    
+    # Start the tail at a line boundary so ^ cannot match in the middle of a line
+    tail_start = content.rfind('\n', 0, max(0, len(content) - _ENDIF_TAIL_CHARS)) + 1
+    
+    last_match = None
+    for match in _ENDIF_LINE_RE.finditer(content, tail_start):
+        last_match = match
+    if last_match is None and tail_start > 0:
+        for match in _ENDIF_LINE_RE.finditer(content, 0, tail_start):
+            last_match = match
+    if last_match is None:
+        return None
+    
+    return last_match.start()
+
+
+def _add_include_to_content(content: str, include_path: str) -> Optional[str]:
+    """
+    Add an include statement to file content, before the last #endif or at the end.
+    
+    Args:
+        content: Content of the repository file
+        include_path: Path to include (relative or absolute)
+        
+    Returns:
+        The new content, or None if the include already exists
+    """
+    # Check if include already exists
+    escaped_include = re.escape(include_path)
+    if re.search(rf'#include\s+["<]{escaped_include}[">]', content):
+        return None
+    
+    # Find the last #endif
+    last_endif_offset = _find_last_endif_offset(content)
+    
+    include_statement = f'#include "{include_path}"'
+    
+    # Add the include by slicing around the insertion point
+    if last_endif_offset is not None:
+        # Insert before the last #endif
+        return content[:last_endif_offset] + include_statement + '\n' + content[last_endif_offset:]
+    # Add at the end, on a line of its own
+    return content + '\n' + include_statement
+
+
+def _comment_repository_annotation_in_content(content: str) -> Optional[str]:
+    """
+    Replace the @Repository annotation with the processed marker in file content.
+    
+    Args:
+        content: Content of the repository file
+        
+    Returns:
+        The new content (unchanged if the annotation was already processed),
+        or None if no annotation was found
+    """
+    # Replace the first /// @Repository or ///@Repository line, preserving space indentation
+    new_content, count = _REPOSITORY_ANNOTATION_LINE_RE.subn(_processed_annotation_line, content, count=1)
+    if count:
+        # print(f"✓ Found @Repository annotation, marking as processed")
+        return new_content
+    
+    # Check if already processed (/* @Repository */)
+    if '@Repository' in content and _PROCESSED_ANNOTATION_LINE_RE.search(content):
+        # print(f"✓ @Repository annotation already processed")
+        return content
+    # print(f"⚠️  @Repository annotation not found")
+    return None
+
+
+def _apply_repository_edits(content: str, include_path: str) -> Optional[str]:
+    """
+    Apply both edits of a processed repository file in memory.
+    
+    Adds the include for the implementation file and marks the @Repository
+    annotation as processed, so the caller can write the file once and
+    either both edits land or neither does.
+    
+    Args:
+        content: Content of the repository file
+        include_path: Path of the implementation file to include
+        
+    Returns:
+        The new content, or None if the include already exists
+    """
+    # Step 5: Add include to the original repository file
+    new_content = _add_include_to_content(content, include_path)
+    if new_content is None:
+        return None
+    
+    # Step 6: Mark the @Repository annotation as processed
+    marked_content = _comment_repository_annotation_in_content(new_content)
+    if marked_content is None:
+        # print(f"⚠️  Repository processed but annotation marking failed")
+        return new_content
+    return marked_content
+
+
+def _read_content(file_path: str) -> Optional[str]:
+    """Read a file as text, or return None if it cannot be read."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        # print(f"Error reading file {file_path}: {e}")
+        return None
 
 
 def add_include_to_file(file_path: str, include_path: str, dry_run: bool = False) -> bool:
@@ -62,51 +221,22 @@ def add_include_to_file(file_path: str, include_path: str, dry_run: bool = False
     Returns:
         True if include was added (or would be added), False otherwise
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        # print(f"Error reading file {file_path}: {e}")
+    content = _read_content(file_path)
+    if content is None:
         return False
     
-    # Check if include already exists
-    escaped_include = re.escape(include_path)
-    if re.search(rf'#include\s+["<]{escaped_include}[">]', content):
+    new_content = _add_include_to_content(content, include_path)
+    if new_content is None:
         # print(f"⚠️  Include for {include_path} already exists in {file_path}")
         return False
     
-    # Find the last #endif
-    last_endif_line = find_last_endif_position(content)
-    
-    lines = content.split('\n')
-    include_statement = f'#include "{include_path}"'
-    
     if dry_run:
-        # if last_endif_line:
-        #     print(f"Would add include before line {last_endif_line} (last #endif)")
-        # else:
-        #     print(f"Would add include at the end of file (no #endif found)")
-        # print(f"  {include_statement}")
+        # print(f"Would add #include \"{include_path}\" to {file_path}")
         return True
     
-    # Add the include
-    if last_endif_line:
-        # Insert before the last #endif
-        insert_index = last_endif_line - 1  # Convert to 0-based
-        lines.insert(insert_index, include_statement)
-    else:
-        # Add at the end
-        lines.append(include_statement)
-    
     # Write back to file
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        # print(f"✓ Added include to {file_path}: {include_path}")
-        return True
-    except Exception as e:
-        # print(f"Error writing file {file_path}: {e}")
-        return False
+    # print(f"✓ Added include to {file_path}: {include_path}")
+    return _write_content(file_path, new_content)
 
 
 def comment_repository_annotation(file_path: str, dry_run: bool = False) -> bool:
@@ -120,61 +250,20 @@ def comment_repository_annotation(file_path: str, dry_run: bool = False) -> bool
     Returns:
         True if annotation was processed (or would be processed), False otherwise
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-    except Exception as e:
-        # print(f"Error reading file {file_path}: {e}")
+    content = _read_content(file_path)
+    if content is None:
         return False
     
-    lines = content.split('\n')
-    modified = False
-    
-    # Find and replace @Repository annotation
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        # Check for /// @Repository or ///@Repository annotation (ignoring whitespace)
-        if re.match(r'^///\s*@Repository\s*$', stripped):
-            # Replace with processed marker, preserving original indentation
-            if line.startswith(' '):
-                # Has indentation, preserve it
-                indent = len(line) - len(line.lstrip())
-                lines[i] = ' ' * indent + '/* @Repository */'
-            else:
-                # No indentation
-                lines[i] = '/* @Repository */'
-            modified = True
-            # print(f"✓ Found @Repository annotation on line {i+1}, marking as processed")
-            break
-    
-    if not modified:
-        # Check if already processed
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            # Check for processed version (/* @Repository */)
-            if re.match(r'^/\*\s*@Repository\s*\*/\s*$', stripped):
-                # print(f"✓ @Repository annotation already processed in {file_path} (line {i+1})")
-                return True
-        # Debug: print first few lines to see what we're looking at
-        # print(f"⚠️  @Repository annotation not found in {file_path}")
-        # print(f"   First 15 lines of file:")
-        # for j, l in enumerate(lines[:15], 1):
-        #     print(f"   {j:2}: {repr(l)}")
+    new_content = _comment_repository_annotation_in_content(content)
+    if new_content is None:
         return False
-    
-    if dry_run:
-        # print(f"Would mark @Repository annotation as processed in {file_path}")
+    if new_content is content or dry_run:
+        # Already processed, or nothing is to be written
         return True
     
     # Write back to file
-    try:
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-        # print(f"✓ Marked @Repository annotation as processed in {file_path}")
-        return True
-    except Exception as e:
-        # print(f"Error writing file {file_path}: {e}")
-        return False
+    # print(f"✓ Marked @Repository annotation as processed in {file_path}")
+    return _write_content(file_path, new_content)
 
 
 def calculate_include_path(source_file_path: str, impl_file_path: str) -> str:
@@ -188,10 +277,18 @@ def calculate_include_path(source_file_path: str, impl_file_path: str) -> str:
     Returns:
         Absolute include path
     """
-    impl_path = Path(impl_file_path).resolve()
+    # Every implementation file lives in the same src/repository directory;
+    # resolve that directory once instead of every path component per call
+    impl_dir, impl_name = os.path.split(impl_file_path)
     
     # Return absolute path
-    return str(impl_path)
+    return os.path.join(_resolved_directory(impl_dir or '.'), impl_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolved_directory(directory: str) -> str:
+    """Resolve a directory to its absolute canonical path (memoized)."""
+    return str(Path(directory).resolve())
 
 
 def process_repository(file_path: str, library_dir: str, dry_run: bool = False) -> bool:
@@ -213,30 +310,17 @@ def process_repository(file_path: str, library_dir: str, dry_run: bool = False)
     # If it doesn't exist, we need to reprocess it
     if not result:
         # Check if annotation is processed but file is missing
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-            processed_pattern = r'/\*\s*@Repository\s*\*/'
-            if re.search(processed_pattern, content):
-                # Annotation is processed, check if file exists
-                class_name_match = re.search(r'DefineStandardPointers\s*\(\s*(\w+)\s*\)', content)
-                if class_name_match:
-                    class_name = class_name_match.group(1)
-                    repository_dir = Path(library_dir) / "src" / "repository"
-                    impl_file_path = repository_dir / f"{class_name}Impl.h"
-                    
-                    if not impl_file_path.exists():
-                        # Reprocess by manually extracting the info and creating the file
-                        content_no_comments = re.sub(r'//.*?$', '', content, flags=re.MULTILINE)
-                        content_no_comments = re.sub(r'/\*.*?\*/', '', content_no_comments, flags=re.DOTALL)
-                        template_match = re.search(rf'class\s+{re.escape(class_name)}\s+(?:final\s+)?:\s*public\s+(?:virtual\s+)?CpaRepository\s*<\s*([^,<>]+)\s*,\s*([^,<>]+)\s*>', content_no_comments)
-                        if template_match:
-                            entity_type = template_match.group(1).strip()
-                            id_type = template_match.group(2).strip()
-                            is_templated = bool(re.search(rf'template\s*<\s*[^>]+\s*>\s*class\s+{re.escape(class_name)}', content_no_comments))
-                            result = (class_name, entity_type, id_type, is_templated)
-        except Exception as e:
-            pass
+        content = _read_content(file_path)
+        if content is not None and find_processed_repository_annotation(content):
+            # Annotation is processed, check if file exists
+            class_name = extract_class_name_from_define_standard_pointers(content)
+            if class_name:
+                repository_dir = Path(library_dir) / "src" / "repository"
+                impl_file_path = repository_dir / f"{class_name}Impl.h"
+                
+                if not impl_file_path.exists():
+                    # Reprocess by extracting the info the same way detect_repository does
+                    result = extract_repository_info(content, class_name)
     
     if not result:
         return False
@@ -271,22 +355,173 @@ def process_repository(file_path: str, library_dir: str, dry_run: bool = False)
     include_path = calculate_include_path(file_path, str(impl_file_path))
     # print(f"📝 Calculated include path: {include_path}")
     
-    # Step 5: Add include to the original repository file
-    include_added = add_include_to_file(file_path, include_path, dry_run)
+    # Steps 5 and 6 edit the same file: read it once and write it once
+    content = _read_content(file_path)
+    if content is None:
+        return False
     
-    if not include_added:
+    new_content = _apply_repository_edits(content, include_path)
+    if new_content is None:
         # print(f"⚠️  Failed to add include for repository {class_name}")
         return False
     
-    # Step 6: Mark the @Repository annotation as processed
-    annotation_processed = comment_repository_annotation(file_path, dry_run)
+    if dry_run:
+        return True
+    
+    # Return True if at least the include was added
+    # print(f"✅ Successfully processed repository {class_name}")
+    return _write_content(file_path, new_content)
+
+
+# Header extensions that can hold a repository declaration
+_HEADER_EXTENSIONS = ('.h', '.hpp')
+
+# Larger files are generated code, never hand-written repository headers
+_MAX_CANDIDATE_BYTES = 1024 * 1024
+
+
+def iter_candidate_files(root: str, max_bytes: int = _MAX_CANDIDATE_BYTES) -> Iterator[str]:
+    """
+    Yield the header files under root that are small enough to hold a repository.
     
-    if include_added and annotation_processed:
-        # print(f"✅ Successfully processed repository {class_name}")
+    Uses os.scandir, whose entries carry the file type (and on most platforms
+    the stat result), so filtering does not cost an extra system call per file.
+    
+    Args:
+        root: Directory to search recursively
+        max_bytes: Files larger than this are skipped
+        
+    Returns:
+        Iterator over the paths of the candidate files
+    """
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(_HEADER_EXTENSIONS) and entry.stat(follow_symlinks=False).st_size <= max_bytes:
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_MIN_FILES = 5
+
+
+def _process_repository_job(job: tuple) -> List[bool]:
+    """Run process_repository on each file of a (file_paths, library_dir, dry_run) job, in order."""
+    file_paths, library_dir, dry_run = job
+    results = []
+    for file_path in file_paths:
+        try:
+            results.append(process_repository(file_path, library_dir, dry_run))
+        except Exception as e:
+            # print(f"⚠️  Warning: Error processing {file_path}: {e}")
+            import traceback
+            traceback.print_exc()
+            results.append(False)
+    return results
+
+
+def _impl_class_key(file_path: str) -> str:
+    """Return the DefineStandardPointers class whose <Class>Impl.h a header may write, or the path itself."""
+    content = _read_content(file_path)
+    if content is None or '@Repository' not in content:
+        return file_path
+    return extract_class_name_from_define_standard_pointers(content) or file_path
+
+
+# Manifest of headers known not to mention @Repository, kept in the batch cache directory
+_MANIFEST_FILE_NAME = "manifest.json"
+
+
+def _mentions_repository(file_path: str) -> bool:
+    """Check whether a file contains @Repository at all (processed or not); unreadable files count as yes."""
+    try:
+        with open(file_path, 'rb') as f:
+            return b'@Repository' in f.read()
+    except OSError:
         return True
+
+
+def process_repository_batch(file_paths: List[str], library_dir: str, dry_run: bool = False, workers: Optional[int] = 1, cache_dir: Optional[str] = None, mp_context=None) -> Dict[str, bool]:
+    """
+    Process many repository files, optionally in parallel worker processes.
+    
+    By default every file is processed in this interpreter, in order. A process
+    pool is only used when the caller opts in with workers other than 1 and the
+    batch is large enough. Headers that declare the same DefineStandardPointers
+    class (and so write the same <Class>Impl.h) are then kept in one job and
+    processed in order, so they never race.
+    
+    With the "spawn" start method (the default on Windows and macOS) each worker
+    re-imports the calling program's __main__ module. Only opt in from a program
+    whose top-level code is guarded by if __name__ == "__main__", or pass an
+    mp_context such as multiprocessing.get_context("fork") where available.
+    
+    Args:
+        file_paths: Paths to the source files to check
+        library_dir: Path to the library directory (where src/repository folder should be)
+        dry_run: If True, don't actually create or modify files
+        workers: Maximum number of worker processes (default 1, no pool; None uses the number of CPUs)
+        cache_dir: Optional directory for a manifest of headers without @Repository; such
+                   headers are skipped on later runs while their mtime and size are unchanged
+        mp_context: Optional multiprocessing context for the pool (e.g. multiprocessing.get_context("fork"))
+        
+    Returns:
+        Dictionary mapping each file path to the result of process_repository
+    """
+    # Each file is processed once even if it is listed several times
+    unique_paths = [str(file_path) for file_path in dict.fromkeys(file_paths)]
+    
+    # Headers without @Repository can never be processed; skip those unchanged since the last run
+    results = {}
+    signatures = {}
+    manifest = load_manifest(cache_dir, _MANIFEST_FILE_NAME) if cache_dir else {}
+    if cache_dir:
+        for file_path in unique_paths:
+            signature = file_signature(file_path)
+            signatures[file_path] = signature
+            if signature is not None and manifest.get(file_path) == signature:
+                results[file_path] = False
+    
+    pending_paths = [file_path for file_path in unique_paths if file_path not in results]
+    
+    if len(pending_paths) >= _PARALLEL_MIN_FILES and workers != 1:
+        from concurrent.futures import ProcessPoolExecutor
+        
+        # Headers that would write the same <Class>Impl.h share a job and run in order
+        groups = {}
+        for file_path in pending_paths:
+            groups.setdefault(_impl_class_key(file_path), []).append(file_path)
+        jobs = [(tuple(group), str(library_dir), dry_run) for group in groups.values()]
+        
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=mp_context) as executor:
+            for job, job_results in zip(jobs, executor.map(_process_repository_job, jobs, chunksize=8)):
+                results.update(zip(job[0], job_results))
     else:
-        # print(f"⚠️  Repository {class_name} processed but annotation marking failed")
-        return include_added  # Return True if at least include was added
+        results.update(zip(pending_paths, _process_repository_job((tuple(pending_paths), str(library_dir), dry_run))))
+    
+    if cache_dir and not dry_run:
+        # Signatures were taken before processing, so a file edited meanwhile is checked again next run
+        new_manifest = {}
+        for file_path in unique_paths:
+            signature = signatures[file_path]
+            if signature is None or results[file_path]:
+                continue
+            if manifest.get(file_path) == signature or not _mentions_repository(file_path):
+                new_manifest[file_path] = signature
+        if new_manifest != manifest:
+            save_manifest(cache_dir, _MANIFEST_FILE_NAME, new_manifest)
+    
+    return {file_path: results[file_path] for file_path in unique_paths}
 
 
 def main():
@@ -298,7 +533,7 @@ def main():
     )
     parser.add_argument(
         "file_path",
-        help="Path to the C++ file to check"
+        help="Path to the C++ file to check, or a directory to check all headers in"
     )
     parser.add_argument(
         "--library-dir",
@@ -313,7 +548,12 @@ def main():
     
     args = parser.parse_args()
     
-    success = process_repository(args.file_path, args.library_dir, args.dry_run)
+    if os.path.isdir(args.file_path):
+        # Run as a script, so the pool's workers can safely re-import this module
+        results = process_repository_batch(sorted(iter_candidate_files(args.file_path)), args.library_dir, args.dry_run, workers=None)
+        success = any(results.values())
+    else:
+        success = process_repository(args.file_path, args.library_dir, args.dry_run)
     
     return 0 if success else 1
 
@@ -321,6 +561,8 @@ def main():
 # Export functions for other scripts to import
 __all__ = [
     'process_repository',
+    'process_repository_batch',
+    'iter_candidate_files',
     'add_include_to_file',
     'calculate_include_path',
     'main'
@@ -8,7 +8,6 @@ Orchestrator script that processes all classes with @Entity annotation in client
 import os
 import sys
 import importlib.util
-from pathlib import Path
 
 # Import get_client_files from parent directory
 # Handle both direct execution and dynamic loading
@@ -26,24 +25,47 @@ except NameError:
         except:
             script_dir = os.getcwd()
 parent_dir = os.path.dirname(script_dir)
-sys.path.insert(0, parent_dir)
-sys.path.insert(0, script_dir)
+# This module may be executed once per build step; only add the paths that are missing
+for import_dir in (parent_dir, script_dir):
+    if import_dir not in sys.path:
+        sys.path.insert(0, import_dir)
 
 try:
     from get_client_files import get_client_files
 except ImportError:
     get_client_files = None
 
-# Import the serializer scripts
-sys.path.insert(0, script_dir)
+from build_cache import file_signature, load_manifest, save_manifest
+
+# Serializer scripts loaded from this directory, keyed by module name
+_SERIALIZER_SCRIPTS = {}
+
 
-spec_s1 = importlib.util.spec_from_file_location("S1_check_dto_macro", os.path.join(script_dir, "S1_check_dto_macro.py"))
-S1_check_dto_macro = importlib.util.module_from_spec(spec_s1)
-spec_s1.loader.exec_module(S1_check_dto_macro)
+def _load_serializer_script(module_name):
+    """
+    Load one of the S* serializer scripts from this directory, executing it only once.
+    
+    The scripts are loaded by file location rather than imported by name, since other
+    libraries' build scripts in the same interpreter ship modules with the same names.
+    
+    Args:
+        module_name: Name of the script without the .py extension (e.g. "S1_check_dto_macro")
+        
+    Returns:
+        The executed module
+    """
+    module = _SERIALIZER_SCRIPTS.get(module_name)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(script_dir, module_name + ".py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        _SERIALIZER_SCRIPTS[module_name] = module
+    return module
 
-spec_s3 = importlib.util.spec_from_file_location("S3_inject_serialization", os.path.join(script_dir, "S3_inject_serialization.py"))
-S3_inject_serialization = importlib.util.module_from_spec(spec_s3)
-spec_s3.loader.exec_module(S3_inject_serialization)
+
+# Import the serializer scripts
+S1_check_dto_macro = _load_serializer_script("S1_check_dto_macro")
+S3_inject_serialization = _load_serializer_script("S3_inject_serialization")
 
 # Import enum serialization script from arduinolib1 (it's shared)
 # Try to find arduinolib1's serialization scripts
@@ -88,56 +110,70 @@ except Exception:
     S8_handle_enum_serialization = None
 
 
+def _scan_dirs(path):
+    """
+    Yield (name, resolved path) for the subdirectories of path, using the type info cached by os.scandir.
+    
+    path must already be resolved; then only symlinked subdirectories need a realpath.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        yield entry.name, (os.path.realpath(entry.path) if entry.is_symlink() else entry.path)
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+
 def discover_all_libraries(project_dir):
-    """Discover all library directories in build/_deps/ (CMake) and .pio/libdeps/ (PlatformIO)."""
+    """Discover all library directories in build/_deps/ (CMake) and .pio/libdeps/ (PlatformIO), as resolved path strings."""
     libraries = []
     seen_libraries = set()
     
     if not project_dir:
         return libraries
     
-    project_path = Path(project_dir).resolve()
-    
-    build_deps = project_path / "build" / "_deps"
-    
-    if build_deps.exists() and build_deps.is_dir():
-        for lib_dir in build_deps.iterdir():
-            if lib_dir.is_dir() and not lib_dir.name.startswith("."):
-                lib_name = lib_dir.name
-                
-                if lib_name.endswith("-src"):
-                    lib_root = lib_dir.resolve()
-                    lib_path_str = str(lib_root)
-                    if lib_path_str not in seen_libraries:
-                        seen_libraries.add(lib_path_str)
-                        libraries.append(lib_root)
-                elif (lib_dir / "src").exists() and (lib_dir / "src").is_dir():
-                    lib_root = lib_dir.resolve()
-                    lib_path_str = str(lib_root)
-                    if lib_path_str not in seen_libraries:
-                        seen_libraries.add(lib_path_str)
-                        libraries.append(lib_root)
-    
-    pio_libdeps = project_path / ".pio" / "libdeps"
-    
-    if pio_libdeps.exists() and pio_libdeps.is_dir():
-        for env_dir in pio_libdeps.iterdir():
-            if env_dir.is_dir():
-                for lib_dir in env_dir.iterdir():
-                    if lib_dir.is_dir():
-                        lib_root = lib_dir.resolve()
-                        lib_path_str = str(lib_root)
-                        
-                        if (lib_root / "src").exists() and (lib_root / "src").is_dir():
-                            if lib_path_str not in seen_libraries:
-                                seen_libraries.add(lib_path_str)
-                                libraries.append(lib_root)
+    # Work on plain strings throughout; callers only need the paths as strings.
+    # Each scanned directory is resolved once, so its entries need no realpath of their own
+    project_path = os.path.realpath(project_dir)
+    
+    build_deps = os.path.realpath(os.path.join(project_path, "build", "_deps"))
+    
+    for lib_name, lib_dir in _scan_dirs(build_deps):
+        if lib_name.startswith("."):
+            continue
+        
+        if lib_name.endswith("-src") or os.path.isdir(os.path.join(lib_dir, "src")):
+            if lib_dir not in seen_libraries:
+                seen_libraries.add(lib_dir)
+                libraries.append(lib_dir)
+    
+    pio_libdeps = os.path.realpath(os.path.join(project_path, ".pio", "libdeps"))
+    
+    for _, env_dir in _scan_dirs(pio_libdeps):
+        for _, lib_dir in _scan_dirs(env_dir):
+            if lib_dir not in seen_libraries and os.path.isdir(os.path.join(lib_dir, "src")):
+                seen_libraries.add(lib_dir)
+                libraries.append(lib_dir)
     
     return libraries
 
 
-def process_all_serializable_classes(dry_run=False, serializable_macro=None):
-    """Process all client files that contain classes with @Entity annotation."""
+# Manifest of headers known not to contain the annotation, kept in the library's cache
+# directory; one file per annotation name, e.g. serialization_manifest_Entity.json
+_MANIFEST_FILE_NAME = "serialization_manifest_{}.json"
+
+
+def process_all_serializable_classes(dry_run=False, serializable_macro=None, cache_dir=None):
+    """
+    Process all client files that contain classes with @Entity annotation.
+    
+    cache_dir is an optional directory for a manifest of headers without the annotation;
+    such headers are not read again on later runs while their mtime and size are unchanged.
+    """
     if serializable_macro is None:
         if 'serializable_macro' in globals():
             serializable_macro = globals()['serializable_macro']
@@ -189,28 +225,95 @@ def process_all_serializable_classes(dry_run=False, serializable_macro=None):
     except Exception as e:
         pass
     
-    for lib_dir in all_libraries:
+    def _library_headers(lib_dir):
         try:
-            lib_files = get_client_files(str(lib_dir), skip_exclusions=True, file_extensions=['.h', '.hpp'])
-            header_files.extend(lib_files)
+            return get_client_files(lib_dir, skip_exclusions=True, file_extensions=['.h', '.hpp'])
         except Exception as e:
-            pass
+            return []
+    
+    # Each library is its own tree, so several are walked at once
+    if len(all_libraries) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(all_libraries))) as executor:
+            for lib_files in executor.map(_library_headers, all_libraries):
+                header_files.extend(lib_files)
+    else:
+        for lib_dir in all_libraries:
+            header_files.extend(_library_headers(lib_dir))
     
     if not header_files:
         return 0
     
+    # A header reached through both the project and a library scan is processed once
+    # (get_client_files returns resolved paths, so duplicates compare equal)
+    header_files = list(dict.fromkeys(header_files))
+    
     processed_count = 0
     
+    # The field/validation scripts and the validation macro definitions do not depend
+    # on the file being processed; they are looked up once, when the first class is found
+    S2_extract_dto_fields = None
+    S7_extract_validation_fields = None
+    validation_macros = None
+    
+    # S1 can only find a class below the annotation (@Entity or @Serializable), so headers
+    # whose raw bytes never contain it are rejected before being decoded and parsed
+    # The shared mapping keeps the byte check, the manifest key and S1 in agreement
+    from extract_id_fields import annotation_name_for_macro
+    annotation_name = annotation_name_for_macro(serializable_macro)
+    annotation_bytes = annotation_name.encode('ascii')
+    
+    # Headers found without the annotation on an earlier run are skipped while unchanged
+    manifest_file_name = _MANIFEST_FILE_NAME.format(annotation_name.lstrip('@'))
+    manifest = load_manifest(cache_dir, manifest_file_name) if cache_dir else {}
+    unannotated = {}
+    
+    def _check_header(file_path):
+        """Read a header and run the S1 class check on it; read-only, so headers can be checked concurrently."""
+        try:
+            if cache_dir:
+                # Taken before reading, so a file edited meanwhile is checked again next run
+                signature = file_signature(file_path)
+                if signature is not None and manifest.get(file_path) == signature:
+                    unannotated[file_path] = signature
+                    return None, {'has_dto': False}
+            with open(file_path, 'rb') as file:
+                if annotation_bytes not in file.read():
+                    if cache_dir and signature is not None:
+                        unannotated[file_path] = signature
+                    return None, {'has_dto': False}
+            with open(file_path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+            dto_info = S1_check_dto_macro.check_dto_macro(file_path, serializable_macro, lines)
+        except Exception:
+            # Leave the file to the sequential pass below
+            return None
+        # Only headers with a class to process need their lines kept
+        return (lines if dto_info and dto_info.get('has_dto') else None), dto_info
+    
+    # The S1 check runs on every header and is independent per file, so it is done up
+    # front in a thread pool; injection below stays sequential
+    if len(header_files) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=min(8, len(header_files))) as executor:
+            header_checks = dict(zip(header_files, executor.map(_check_header, header_files)))
+    else:
+        header_checks = {file_path: _check_header(file_path) for file_path in header_files}
+    
     for file_path in header_files:
         if not os.path.exists(file_path):
             continue
         
+        header_check = header_checks.get(file_path)
+        
         # First, check if file has enum with @Serializable annotation
         if S8_handle_enum_serialization:
             enum_info = S8_handle_enum_serialization.check_enum_annotation(file_path, serializable_macro)
             if enum_info and enum_info.get('has_enum'):
                 # Process enum serialization
                 if not dry_run:
+                    # The file may be rewritten here, so the up-front check no longer applies
+                    header_check = None
                     enum_name = enum_info['enum_name']
                     enum_line = enum_info['enum_line']
                     annotation_line = enum_info['annotation_line']
@@ -234,54 +337,56 @@ def process_all_serializable_classes(dry_run=False, serializable_macro=None):
                             S8_handle_enum_serialization.mark_enum_annotation_processed(file_path, annotation_line, dry_run=False)
                             processed_count += 1
         
-        # Check if file has @Entity/@Serializable annotation (for classes)
-        dto_info = S1_check_dto_macro.check_dto_macro(file_path, serializable_macro)
+        if header_check is not None:
+            lines, dto_info = header_check
+        else:
+            # Read the header once for the read-only stages (S1, S2, S7 and @Id extraction);
+            # this happens after the enum step, which may have rewritten the file
+            try:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    lines = file.readlines()
+            except Exception:
+                lines = None
+            
+            # Check if file has @Entity/@Serializable annotation (for classes)
+            dto_info = S1_check_dto_macro.check_dto_macro(file_path, serializable_macro, lines)
         
         if not dto_info or not dto_info.get('has_dto'):
             continue
         
         class_name = dto_info['class_name']
         
-        import S2_extract_dto_fields
-        spec_s2 = importlib.util.spec_from_file_location("S2_extract_dto_fields", os.path.join(script_dir, "S2_extract_dto_fields.py"))
-        S2_extract_dto_fields = importlib.util.module_from_spec(spec_s2)
-        spec_s2.loader.exec_module(S2_extract_dto_fields)
+        if S2_extract_dto_fields is None:
+            S2_extract_dto_fields = _load_serializer_script("S2_extract_dto_fields")
+            
+            S6_discover_validation_macros = _load_serializer_script("S6_discover_validation_macros")
+            validation_macros = S6_discover_validation_macros.find_validation_macro_definitions(None)
+            
+            S7_extract_validation_fields = _load_serializer_script("S7_extract_validation_fields")
         
-        fields = S2_extract_dto_fields.extract_all_fields(file_path, class_name)
+        fields = S2_extract_dto_fields.extract_all_fields(file_path, class_name, lines)
         
         if not fields:
             pass
         
-        optional_fields = [field for field in fields if S3_inject_serialization.is_optional_type(field['type'].strip())]
-        non_optional_fields = [field for field in fields if not S3_inject_serialization.is_optional_type(field['type'].strip())]
-        
-        import S6_discover_validation_macros
-        spec_s6 = importlib.util.spec_from_file_location("S6_discover_validation_macros", os.path.join(script_dir, "S6_discover_validation_macros.py"))
-        S6_discover_validation_macros = importlib.util.module_from_spec(spec_s6)
-        spec_s6.loader.exec_module(S6_discover_validation_macros)
-        
-        validation_macros = S6_discover_validation_macros.find_validation_macro_definitions(None)
-        
-        import S7_extract_validation_fields
-        spec_s7 = importlib.util.spec_from_file_location("S7_extract_validation_fields", os.path.join(script_dir, "S7_extract_validation_fields.py"))
-        S7_extract_validation_fields = importlib.util.module_from_spec(spec_s7)
-        spec_s7.loader.exec_module(S7_extract_validation_fields)
+        # Only whether any field is optional matters here (for the <optional> include)
+        has_optional_fields = any(S3_inject_serialization.is_optional_type(field['type']) for field in fields)
         
         validation_fields_by_macro = S7_extract_validation_fields.extract_validation_fields(
-            file_path, class_name, validation_macros
+            file_path, class_name, validation_macros, lines
         )
         
         # Extract @Id fields for primary key methods
         try:
             from extract_id_fields import extract_id_fields
-            id_fields = extract_id_fields(file_path, class_name)
+            id_fields = extract_id_fields(file_path, class_name, lines=lines)
         except Exception:
             id_fields = []
         
         methods_code = S3_inject_serialization.generate_serialization_methods(class_name, fields, validation_fields_by_macro, id_fields)
         
         if not dry_run:
-            if optional_fields:
+            if has_optional_fields:
                 S3_inject_serialization.add_include_if_needed(file_path, "<optional>")
         
         success = S3_inject_serialization.inject_methods_into_class(file_path, class_name, methods_code, dry_run=dry_run)
@@ -290,6 +395,10 @@ def process_all_serializable_classes(dry_run=False, serializable_macro=None):
             if not dry_run:
                 S3_inject_serialization.comment_dto_macro(file_path, dry_run=False, serializable_macro=serializable_macro)
             processed_count += 1
+    
+    if cache_dir and not dry_run and unannotated != manifest:
+        save_manifest(cache_dir, manifest_file_name, unannotated)
+    
     return processed_count
 
 
@@ -301,7 +410,12 @@ def main():
     elif 'SERIALIZABLE_MACRO' in os.environ:
         serializable_macro = os.environ['SERIALIZABLE_MACRO']
     
-    processed_count = process_all_serializable_classes(dry_run=False, serializable_macro=serializable_macro)
+    # Share the cache directory the pre-build script uses for the repository manifest
+    cache_dir = None
+    if globals().get('library_dir'):
+        cache_dir = os.path.join(str(globals()['library_dir']), ".springbootplusplus_data_cache")
+    
+    processed_count = process_all_serializable_classes(dry_run=False, serializable_macro=serializable_macro, cache_dir=cache_dir)
     
     return 0
 
@@ -7,28 +7,43 @@ This script checks if a C++ class has the @Entity annotation above it.
 
 import re
 import argparse
+import functools
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 
-def check_dto_annotation(file_path: str, serializable_annotation: str = "_Entity") -> Optional[Dict[str, any]]:
+# Class declarations, and names of other annotations/macros allowed between the annotation and the class
+_CLASS_RE = re.compile(r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])')
+_MACRO_CALL_RE = re.compile(r'^[A-Z][A-Za-z0-9_]*\s*(?:\(|$)')
+
+
+@functools.lru_cache(maxsize=8)
+def _annotation_patterns(annotation_name: str) -> tuple:
+    """Return the compiled (annotation, processed marker) search functions for an annotation name."""
+    return (re.compile(rf'/\*\s*{re.escape(annotation_name)}\s*\*/').search,
+            re.compile(rf'/\*--\s*{re.escape(annotation_name)}\s*--\*/').search)
+
+
+def check_dto_annotation(file_path: str, serializable_annotation: str = "_Entity", lines: Optional[List[str]] = None) -> Optional[Dict[str, any]]:
     """
     Check if a C++ file contains a class with the @Entity or @Serializable annotation above it.
     
     Args:
         file_path: Path to the C++ file
         serializable_annotation: Name of the annotation identifier (Serializable -> @Serializable, _Entity -> @Entity)
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
         Dictionary with 'class_name', 'has_dto', 'line_number' if found, None otherwise
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except FileNotFoundError:
-        pass
-    except Exception as e:
-        pass
+    if lines is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            pass
     
     # Determine annotation name based on annotation identifier
     if serializable_annotation == "_Entity":
@@ -39,47 +54,49 @@ def check_dto_annotation(file_path: str, serializable_annotation: str = "_Entity
         # Default to @Serializable for backward compatibility
         annotation_name = "@Serializable"
     
-    # Pattern to match /* @Entity */ or /*@Entity*/ or /* @Serializable */ or /*@Serializable*/ annotation (ignoring whitespace)
+    # Match /* @Entity */ or /*@Entity*/ or /* @Serializable */ or /*@Serializable*/ annotation (ignoring whitespace)
     # Also check for already processed /*--@Entity--*/ or /*--@Serializable--*/ pattern
-    annotation_pattern = rf'/\*\s*{re.escape(annotation_name)}\s*\*/'
-    processed_pattern = rf'/\*--\s*{re.escape(annotation_name)}\s*--\*/'
+    # (compiled once per annotation name)
+    annotation_search, processed_search = _annotation_patterns(annotation_name)
     
-    # Pattern to match class declarations
-    class_pattern = r'class\s+([A-Za-z_][A-Za-z0-9_]*)\s*(?:[:{])'
+    # Strip every line once; the look-ahead below revisits the same lines
+    stripped_lines = [line.strip() for line in lines]
     
-    for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
+    for line_num, stripped_line in enumerate(stripped_lines, 1):
+        # Only lines containing the annotation name can start a match
+        if annotation_name not in stripped_line:
+            continue
         
         # Check if line is already processed (/*--@Entity--*/ or /*--@Serializable--*/)
-        if re.search(processed_pattern, stripped_line):
+        if processed_search(stripped_line):
             continue
         
         # Skip other comments that aren't @Entity/@Serializable annotations
         # But allow /* @Entity */ or /* @Serializable */ annotations to be processed
-        if stripped_line.startswith('/*') and not re.search(annotation_pattern, stripped_line):
+        if stripped_line.startswith('/*') and not annotation_search(stripped_line):
             continue
         # Skip single-line comments
         if stripped_line.startswith('//'):
             continue
         
         # Check for annotation (/* @Entity */ or /*@Entity*/ or /* @Serializable */ or /*@Serializable*/)
-        annotation_match = re.search(annotation_pattern, stripped_line)
+        annotation_match = annotation_search(stripped_line)
         if annotation_match:
             # Look ahead for class declaration (within next 10 lines)
-            for i in range(line_num, min(line_num + 11, len(lines) + 1)):
-                if i <= len(lines):
-                    next_line = lines[i - 1].strip()
+            for i in range(line_num, min(line_num + 11, len(stripped_lines) + 1)):
+                if i <= len(stripped_lines):
+                    next_line = stripped_lines[i - 1]
                     
                     # Skip other comments that aren't annotations
                     # But allow /* @Entity */ or /* @Serializable */ annotations to be processed
-                    if next_line.startswith('/*') and not re.search(annotation_pattern, next_line):
+                    if next_line.startswith('/*') and not annotation_search(next_line):
                         continue
                     # Skip single-line comments
                     if next_line.startswith('//'):
                         continue
                     
                     # Check for class declaration
-                    class_match = re.search(class_pattern, next_line)
+                    class_match = _CLASS_RE.search(next_line)
                     if class_match:
                         class_name = class_match.group(1)
                         return {
@@ -93,8 +110,8 @@ def check_dto_annotation(file_path: str, serializable_annotation: str = "_Entity
                     # Check if it starts with known annotations/macros
                     known_annotations = ('COMPONENT', 'SCOPE', 'VALIDATE', 'Dto')
                     if next_line and not (next_line.startswith(known_annotations) or 
-                                         re.match(r'^[A-Z][A-Za-z0-9_]*\s*(?:\(|$)', next_line) or
-                                         re.search(annotation_pattern, next_line)):
+                                         _MACRO_CALL_RE.match(next_line) or
+                                         annotation_search(next_line)):
                         break
     
     return {
@@ -142,12 +159,12 @@ def main():
 
 
 # Backward compatibility alias
-def check_dto_macro(file_path: str, serializable_macro: str = "_Entity") -> Optional[Dict[str, any]]:
+def check_dto_macro(file_path: str, serializable_macro: str = "_Entity", lines: Optional[List[str]] = None) -> Optional[Dict[str, any]]:
     """
     Deprecated: Use check_dto_annotation instead.
     Check if a C++ file contains a class with the @Entity or @Serializable annotation above it.
     """
-    return check_dto_annotation(file_path, serializable_macro)
+    return check_dto_annotation(file_path, serializable_macro, lines)
 
 
 # Export functions for other scripts to import
@@ -7,43 +7,69 @@ This script extracts all member variables from a class with @Entity annotation.
 
 import re
 import argparse
+import functools
 from pathlib import Path
 from typing import List, Dict, Optional
 
 
-def find_class_boundaries(file_path: str, class_name: str) -> Optional[tuple]:
+def find_class_boundaries(file_path: str, class_name: str, lines: Optional[List[str]] = None) -> Optional[tuple]:
     """
     Find the start and end line numbers of a class definition.
     
     Args:
         file_path: Path to the C++ file
         class_name: Name of the class to find
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
         Tuple of (start_line, end_line) or None if not found
     """
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except Exception as e:
-        pass
+    if lines is None:
+        # Stream the file so reading stops as soon as the class is closed
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                return _scan_class_boundaries(file, class_name)
+        except Exception as e:
+            return None
+    
+    return _scan_class_boundaries(lines, class_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _class_re(class_name: str):
+    """Return the compiled pattern matching the declaration of class_name."""
+    return re.compile(rf'class\s+{re.escape(class_name)}\b')
+
+
+def _scan_class_boundaries(lines, class_name: str) -> Optional[tuple]:
+    """
+    Find the class boundaries in an iterable of lines, stopping at the closing brace.
     
+    Args:
+        lines: Iterable of lines (a list or an open file)
+        class_name: Name of the class to find
+        
+    Returns:
+        Tuple of (start_line, end_line) or None if not found
+    """
     class_start = None
     brace_count = 0
     in_class = False
     
-    # Pattern to match class declaration
-    class_pattern = rf'class\s+{re.escape(class_name)}'
+    # Pattern to match class declaration (compiled once per class name)
+    class_search = _class_re(class_name).search
     
     for line_num, line in enumerate(lines, 1):
-        stripped_line = line.strip()
+        # Only leading whitespace matters for the comment test; braces are counted
+        # on the same text, so the trailing side need not be stripped
+        stripped_line = line.lstrip()
         
         # Skip commented lines
-        if stripped_line.startswith('//') or stripped_line.startswith('/*') or stripped_line.startswith('*'):
+        if stripped_line.startswith(('//', '/*', '*')):
             continue
         
         # Check for class declaration
-        if not in_class and re.search(class_pattern, stripped_line):
+        if not in_class and class_name in stripped_line and class_search(stripped_line):
             class_start = line_num
             in_class = True
             # Initialize brace count from this line
@@ -61,44 +87,46 @@ def find_class_boundaries(file_path: str, class_name: str) -> Optional[tuple]:
     return None
 
 
-def extract_all_fields(file_path: str, class_name: str) -> List[Dict[str, str]]:
+def extract_all_fields(file_path: str, class_name: str, lines: Optional[List[str]] = None) -> List[Dict[str, str]]:
     """
     Extract all member variables (public, private, protected) from a class.
     
     Args:
         file_path: Path to the C++ file
         class_name: Name of the class
+        lines: Optional already-read lines of the file (avoids reading it again)
         
     Returns:
         List of dictionaries with 'type' and 'name' keys
     """
-    boundaries = find_class_boundaries(file_path, class_name)
+    boundaries = find_class_boundaries(file_path, class_name, lines)
     if not boundaries:
         return []
     
     start_line, end_line = boundaries
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except Exception as e:
-        pass
+    if lines is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+        except Exception as e:
+            pass
     
     class_lines = lines[start_line - 1:end_line]
     
     fields = []
     current_access = None
     
-    # Patterns
-    access_pattern = r'^\s*(public|private|protected)\s*:'
+    # Patterns (matched with re.match against stripped lines, so no ^\s* anchor)
+    access_pattern = r'(public|private|protected)\s*:'
     # Field pattern: matches "int a;" or "StdString name;"
-    field_pattern = r'^\s*([A-Za-z_][A-Za-z0-9_<>*&,\s]*?)\s+([A-Za-z_][A-Za-z0-9_]*)\s*[;=]'
+    field_pattern = r'([A-Za-z_][A-Za-z0-9_<>*&,\s]*?)\s+([A-Za-z_][A-Za-z0-9_]*)\s*[;=]'
     
     for line in class_lines:
         stripped = line.strip()
         
         # Skip comments
-        if stripped.startswith('//') or stripped.startswith('/*'):
+        if stripped.startswith(('//', '/*')):
             continue
         
         # Skip empty lines
@@ -106,14 +134,14 @@ def extract_all_fields(file_path: str, class_name: str) -> List[Dict[str, str]]:
             continue
         
         # Check for access specifier (case insensitive)
-        access_match = re.search(access_pattern, stripped, re.IGNORECASE)
+        access_match = re.match(access_pattern, stripped, re.IGNORECASE)
         if access_match:
             current_access = access_match.group(1).lower()
             continue
         
         # Process all members (public, private, protected) - no access restriction
         # Check for member variable
-        field_match = re.search(field_pattern, stripped)
+        field_match = re.match(field_pattern, stripped)
         if field_match:
             field_type = field_match.group(1).strip()
             field_name = field_match.group(2).strip()
@@ -6,6 +6,7 @@ This script injects Serialize() and Deserialize() methods into Entity classes.
 """
 
 import argparse
+import functools
 import sys
 import os
 import re
@@ -412,6 +413,13 @@ def generate_serialization_methods(class_name: str, fields: List[Dict[str, str]]
     return "\n".join(code_lines)
 
 
+@functools.lru_cache(maxsize=8)
+def _annotation_marker_patterns(annotation_name: str) -> tuple:
+    """Return the compiled (processed marker, annotation) match functions for whole annotation lines."""
+    return (re.compile(rf'^/\*--\s*{re.escape(annotation_name)}\s*--\*/\s*$').match,
+            re.compile(rf'^/\*\s*{re.escape(annotation_name)}\s*\*/\s*$').match)
+
+
 def mark_dto_annotation_processed(file_path: str, dry_run: bool = False, serializable_annotation: str = "_Entity") -> bool:
     """Replace the /* @Entity */ or /* @Serializable */ annotation with processed marker /*--@Entity--*/ or /*--@Serializable--*/ in a C++ file."""
     try:
@@ -428,17 +436,21 @@ def mark_dto_annotation_processed(file_path: str, dry_run: bool = False, seriali
         modified = False
         modified_lines = []
         
-        processed_pattern = rf'^/\*--\s*{re.escape(annotation_name)}\s*--\*/\s*$'
-        annotation_pattern = rf'^/\*\s*{re.escape(annotation_name)}\s*\*/\s*$'
+        processed_match, annotation_match = _annotation_marker_patterns(annotation_name)
         
         for i, line in enumerate(lines):
+            # Both patterns contain the annotation name, so other lines are kept as they are
+            if annotation_name not in line:
+                modified_lines.append(line)
+                continue
+            
             stripped_line = line.strip()
             
-            if re.match(processed_pattern, stripped_line):
+            if processed_match(stripped_line):
                 modified_lines.append(line)
                 continue
             
-            if re.match(annotation_pattern, stripped_line):
+            if annotation_match(stripped_line):
                 if line.startswith(' '):
                     indent = len(line) - len(line.lstrip())
                     if not dry_run:
@@ -60,8 +60,8 @@ def find_validation_macro_definitions(search_directories: List[str] = None) -> D
                     pass
             if library_dir:
                 try:
-                    library_files = get_client_files(library_dir, skip_exclusions=True)
-                    library_header_files = [f for f in library_files if f.endswith(('.h', '.hpp'))]
+                    # Headers are picked out during the walk, not from a list of every library file
+                    library_header_files = get_client_files(library_dir, file_extensions=['.h', '.hpp'], skip_exclusions=True)
                     header_files.extend(library_header_files)
                 except Exception as e:
                     pass
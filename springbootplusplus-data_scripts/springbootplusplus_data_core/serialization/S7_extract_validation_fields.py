@@ -9,6 +9,7 @@ Uses discovered validation macros to find fields with validation annotations.
 import re
 import sys
 import os
+import functools
 from pathlib import Path
 from typing import List, Dict, Optional, Set
 
@@ -52,34 +53,53 @@ def get_validation_function_info(validation_macros: Dict[str, str], macro_name:
     }
 
 
-def extract_validation_fields(file_path: str, class_name: str, validation_macros: Dict[str, str]) -> Dict[str, List[Dict[str, str]]]:
-    """Extract all fields with validation annotations."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            lines = file.readlines()
-    except Exception as e:
-        pass
+@functools.lru_cache(maxsize=32)
+def _validation_patterns(macro_names: tuple) -> tuple:
+    """
+    Compile the annotation patterns for a set of validation macros.
+    
+    The discovered macros are the same for every class in a run, so the
+    patterns are built once per set of macro names instead of once per class.
+    
+    Args:
+        macro_names: Tuple of validation macro names, in discovery order
+        
+    Returns:
+        Tuple of (search function of the combined pattern, {macro_name: compiled pattern})
+    """
+    annotation_patterns = {}
+    for macro_name in macro_names:
+        annotation_patterns[macro_name] = re.compile(rf'///\s*@{re.escape(macro_name)}\b')
     
-    boundaries = S2_extract_dto_fields.find_class_boundaries(file_path, class_name)
+    all_annotations = '|'.join(pattern.pattern for pattern in annotation_patterns.values())
+    return re.compile(rf'({all_annotations})').search, annotation_patterns
+
+
+def extract_validation_fields(file_path: str, class_name: str, validation_macros: Dict[str, str], lines: Optional[List[str]] = None) -> Dict[str, List[Dict[str, str]]]:
+    """Extract all fields with validation annotations (lines: optional already-read lines of the file)."""
+    if lines is None:
+        try:
+            with open(file_path, 'r', encoding='utf-8') as file:
+                lines = file.readlines()
+        except Exception as e:
+            pass
+    
+    boundaries = S2_extract_dto_fields.find_class_boundaries(file_path, class_name, lines)
     if not boundaries:
         return {}
     
     start_line, end_line = boundaries
     class_lines = lines[start_line - 1:end_line]
     
-    macro_names = list(validation_macros.keys())
+    macro_names = tuple(validation_macros.keys())
     if not macro_names:
         return {}
     
-    annotation_patterns = {}
-    for macro_name in macro_names:
-        annotation_patterns[macro_name] = rf'///\s*@{re.escape(macro_name)}\b'
-    
-    all_annotations = '|'.join(annotation_patterns.values())
-    validation_pattern = rf'({all_annotations})'
+    validation_search, annotation_patterns = _validation_patterns(macro_names)
     
-    access_pattern = r'^\s*(public|private|protected)\s*:'
-    field_pattern = r'^\s*(?:Public|Private|Protected)?\s*([A-Za-z_][A-Za-z0-9_<>*&,\s]*?)\s+([A-Za-z_][A-Za-z0-9_]*)\s*[;=]'
+    # Matched with re.match against stripped lines, so no ^\s* anchor
+    access_pattern = r'(public|private|protected)\s*:'
+    field_pattern = r'(?:Public|Private|Protected)?\s*([A-Za-z_][A-Za-z0-9_<>*&,\s]*?)\s+([A-Za-z_][A-Za-z0-9_]*)\s*[;=]'
     
     result = {macro: [] for macro in macro_names}
     
@@ -93,7 +113,7 @@ def extract_validation_fields(file_path: str, class_name: str, validation_macros
         if stripped.startswith('/*'):
             i += 1
             continue
-        if stripped.startswith('//') and not re.search(validation_pattern, stripped):
+        if stripped.startswith('//') and not validation_search(stripped):
             i += 1
             continue
         
@@ -101,17 +121,17 @@ def extract_validation_fields(file_path: str, class_name: str, validation_macros
             i += 1
             continue
         
-        access_match = re.search(access_pattern, stripped, re.IGNORECASE)
+        access_match = re.match(access_pattern, stripped, re.IGNORECASE)
         if access_match:
             current_access = access_match.group(1).lower()
             i += 1
             continue
         
-        validation_match = re.search(validation_pattern, stripped)
+        validation_match = validation_search(stripped)
         if validation_match:
             matched_annotation = None
             for macro_name, pattern in annotation_patterns.items():
-                if re.search(pattern, stripped):
+                if pattern.search(stripped):
                     matched_annotation = macro_name
                     break
             
@@ -131,10 +151,10 @@ def extract_validation_fields(file_path: str, class_name: str, validation_macros
                         if not next_line:
                             continue
                         
-                        if re.search(validation_pattern, next_line):
+                        if validation_search(next_line):
                             continue
                         
-                        field_match = re.search(field_pattern, next_line)
+                        field_match = re.match(field_pattern, next_line)
                         if field_match:
                             field_type = field_match.group(1).strip()
                             field_name = field_match.group(2).strip()
@@ -157,8 +177,8 @@ def extract_validation_fields(file_path: str, class_name: str, validation_macros
                                 found_field = True
                             break
                         
-                        if next_line and (re.search(access_pattern, next_line, re.IGNORECASE) or 
-                                         re.search(r'^\s*(Dto|Serializable|COMPONENT|SCOPE|VALIDATE|///\s*@(NotNull|NotEmpty|NotBlank|Id|Entity|Serializable))\s*$', next_line)):
+                        if next_line and (re.match(access_pattern, next_line, re.IGNORECASE) or 
+                                         re.fullmatch(r'(Dto|Serializable|COMPONENT|SCOPE|VALIDATE|///\s*@(NotNull|NotEmpty|NotBlank|Id|Entity|Serializable))', next_line)):
                             break
             
             i += 1
@@ -4,11 +4,46 @@ This script processes @Entity annotations using local serialization scripts.
 """
 
 import os
-import sys
-import importlib.util
 from pathlib import Path
 
 
+# Loaded serializer modules, keyed by (script path, modification time, project directory)
+_SERIALIZER_MOD_CACHE = {}
+
+
+def _load_serializer_module(serializer_script_path, project_dir):
+    """
+    Load 00_process_serializable_classes.py, reusing the module from an earlier call.
+    
+    The script (and the S1/S3/S8 scripts it loads at import) is only executed
+    again when its file has changed or the project directory it was loaded
+    for (used to locate S8) is different.
+    
+    Args:
+        serializer_script_path: Path to 00_process_serializable_classes.py
+        project_dir: Path to the client project root
+        
+    Returns:
+        The executed serializer module
+    """
+    key = (str(serializer_script_path), os.stat(serializer_script_path).st_mtime_ns, project_dir)
+    serializer_module = _SERIALIZER_MOD_CACHE.get(key)
+    if serializer_module is None:
+        # Only needed when the script has to be (re)loaded
+        import importlib.util
+        
+        spec = importlib.util.spec_from_file_location("process_serializable_classes", str(serializer_script_path))
+        serializer_module = importlib.util.module_from_spec(spec)
+        
+        # Set __file__ so script_dir can be calculated correctly
+        serializer_module.__dict__['__file__'] = str(serializer_script_path)
+        
+        # Execute the module (this will run the top-level code)
+        spec.loader.exec_module(serializer_module)
+        _SERIALIZER_MOD_CACHE[key] = serializer_module
+    return serializer_module
+
+
 def execute_scripts(project_dir, library_dir):
     """
     Execute the scripts to process client files.
@@ -27,10 +62,21 @@ def execute_scripts(project_dir, library_dir):
     serializable_macro = os.environ.get("SERIALIZABLE_MACRO", "_Entity")
     globals()['serializable_macro'] = serializable_macro
     
-    # Add springbootplusplus-data_scripts to path
+    # Set environment variables once so the serializer script can access project_dir,
+    # library_dir and the macro name; assignments that would not change a value are skipped
+    for env_name, env_value in (
+        ('PROJECT_DIR', project_dir),
+        ('CMAKE_PROJECT_DIR', project_dir),
+        ('LIBRARY_DIR', str(library_dir) if library_dir else None),
+        ('SERIALIZABLE_MACRO', serializable_macro),
+    ):
+        if env_value and os.environ.get(env_name) != env_value:
+            os.environ[env_name] = env_value
+    
+    # The serializer script is loaded by file location and puts its own
+    # directories on sys.path, so nothing is added here
     current_file = Path(__file__).resolve()
     springbootplusplus_data_scripts_dir = current_file.parent
-    sys.path.insert(0, str(springbootplusplus_data_scripts_dir))
     
     # Run the master serializer script (00_process_serializable_classes.py) from local scripts
     # This now generates both serialization methods AND primary key methods in one pass
@@ -38,50 +84,31 @@ def execute_scripts(project_dir, library_dir):
         # Get the serialization directory
         serialization_dir = springbootplusplus_data_scripts_dir / 'springbootplusplus_data_core' / 'serialization'
         
-        if serialization_dir.exists():
-            serializer_script_path = serialization_dir / '00_process_serializable_classes.py'
-            if serializer_script_path.exists():
-                try:
-                    # Set environment variables so serializer script can access project_dir and library_dir
-                    if project_dir:
-                        os.environ['PROJECT_DIR'] = project_dir
-                        os.environ['CMAKE_PROJECT_DIR'] = project_dir
-                    if library_dir:
-                        os.environ['LIBRARY_DIR'] = str(library_dir)
-                    # Set serializable macro name
-                    os.environ['SERIALIZABLE_MACRO'] = serializable_macro
-                    
-                    # Load and execute the serializer script
-                    spec = importlib.util.spec_from_file_location("process_serializable_classes", str(serializer_script_path))
-                    serializer_module = importlib.util.module_from_spec(spec)
-                    
-                    # Add serialization directory to path for imports
-                    sys.path.insert(0, str(serialization_dir))
-                    
-                    # Set __file__ so script_dir can be calculated correctly
-                    serializer_module.__dict__['__file__'] = str(serializer_script_path)
-                    
-                    # Execute the module (this will run the top-level code)
-                    spec.loader.exec_module(serializer_module)
-                    
-                    # Set globals AFTER module execution so they're available to functions
-                    serializer_module.__dict__['project_dir'] = project_dir
-                    serializer_module.__dict__['library_dir'] = library_dir
-                    serializer_module.__dict__['serializable_macro'] = serializable_macro
-                    # Also set as attributes so they're accessible
-                    serializer_module.project_dir = project_dir
-                    serializer_module.library_dir = library_dir
-                    serializer_module.serializable_macro = serializable_macro
-                    
-                    # Call the main function if it exists
-                    if hasattr(serializer_module, 'main'):
-                        serializer_module.main()
-                    elif hasattr(serializer_module, 'process_all_serializable_classes'):
-                        serializer_module.process_all_serializable_classes(dry_run=False, serializable_macro=serializable_macro)
-                    
-                except Exception as e:
-                    import traceback
-                    traceback.print_exc()
+        # One stat answers both "does the directory exist" and "does the script exist"
+        serializer_script_path = serialization_dir / '00_process_serializable_classes.py'
+        if os.path.isfile(serializer_script_path):
+            try:
+                # Load the serializer script (executed only on the first call or after it changes)
+                serializer_module = _load_serializer_module(serializer_script_path, project_dir)
+                
+                # Set globals AFTER module execution so they're available to functions
+                serializer_module.__dict__['project_dir'] = project_dir
+                serializer_module.__dict__['library_dir'] = library_dir
+                serializer_module.__dict__['serializable_macro'] = serializable_macro
+                # Also set as attributes so they're accessible
+                serializer_module.project_dir = project_dir
+                serializer_module.library_dir = library_dir
+                serializer_module.serializable_macro = serializable_macro
+                
+                # Call the main function if it exists
+                if hasattr(serializer_module, 'main'):
+                    serializer_module.main()
+                elif hasattr(serializer_module, 'process_all_serializable_classes'):
+                    serializer_module.process_all_serializable_classes(dry_run=False, serializable_macro=serializable_macro)
+                
+            except Exception as e:
+                import traceback
+                traceback.print_exc()
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -1,6 +1,7 @@
 # Import required modules first
 import sys
 import os
+import re
 from pathlib import Path
 
 # Print message immediately when script is loaded
@@ -24,27 +25,115 @@ try:
 except NameError:
     # Not running in PlatformIO environment (e.g., running from CMake)
     # print("Note: Not running in PlatformIO environment - some features may be limited")
-    # Create a mock env object for CMake builds
-    class MockEnv:
-        def get(self, key, default=None):
-            return default
-        def __contains__(self, key):
-            return False
-        def __getitem__(self, key):
-            raise KeyError(key)
-    env = MockEnv()
+    # Use an empty dict as the env for CMake builds; it has the same get/in/[] behaviour
+    # an empty mock environment would have
+    env = {}
 except Exception as e:
     # print(f"Note: Could not import PlatformIO env: {e}")
     import traceback
     traceback.print_exc()
-    class MockEnv:
-        def get(self, key, default=None):
-            return default
-        def __contains__(self, key):
-            return False
-        def __getitem__(self, key):
-            raise KeyError(key)
-    env = MockEnv()
+    env = {}
+
+
+# Names of this library's directories, derived once from the library name
+_LIBRARY_NAME = "springbootplusplus-data"
+_SCRIPTS_DIR_NAME = f"{_LIBRARY_NAME}_scripts"   # springbootplusplus-data_scripts
+_LIB_SRC_NAME = f"{_LIBRARY_NAME}-src"           # CMake FetchContent source directory
+
+# A CMake FetchContent source directory ("arduinolib1-src"), capturing the library name
+_FETCHCONTENT_SRC_DIR_RE = re.compile(r'(?P<name>.*)-src', re.DOTALL)
+
+# This library's name anywhere in a directory name, case-insensitively
+_LIBRARY_NAME_SEARCH = re.compile(re.escape(_LIBRARY_NAME), re.IGNORECASE).search
+
+
+# Subdirectories of the directories visited while searching, keyed by directory path
+_CHILD_DIRS_CACHE = {}
+
+
+def _child_dirs(directory):
+    """
+    Return the subdirectories of a directory as a {name: path} dictionary.
+    
+    Each directory is listed once per run with os.scandir, so the searches
+    below (which walk up overlapping chains of parent directories) answer
+    "does current/<name> exist?" with a dictionary lookup instead of stat calls.
+    
+    Args:
+        directory: Directory to list
+        
+    Returns:
+        Dictionary mapping subdirectory names to their paths (empty if unreadable)
+    """
+    key = str(directory)
+    children = _CHILD_DIRS_CACHE.get(key)
+    if children is None:
+        children = {}
+        try:
+            with os.scandir(key) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir():
+                            children[entry.name] = entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            pass
+        _CHILD_DIRS_CACHE[key] = children
+    return children
+
+
+def _resolve_child(parent_real, name, path):
+    """
+    Resolve parent/name when the parent's resolved path is already known.
+    
+    Only a symlinked entry needs a full realpath (one lstat per path component);
+    anything else resolves to the resolved parent joined with its name.
+    
+    Args:
+        parent_real: Resolved path of the parent directory
+        name: Name of the entry
+        path: Unresolved path of the entry
+        
+    Returns:
+        str: Resolved path of the entry
+    """
+    if os.path.islink(path):
+        return os.path.realpath(path)
+    return os.path.join(parent_real, name)
+
+
+# Resolved .pio/libdeps listings, keyed by the directory holding .pio
+_PIO_LIBRARY_DIRS_CACHE = {}
+
+
+def _pio_library_dirs(directory):
+    """
+    Return the PlatformIO libraries installed under directory/.pio/libdeps.
+    
+    Flattens the .pio/libdeps/<env>/<library>/ layout into one list, so
+    callers loop over libraries once instead of nesting env and library loops.
+    Library paths are resolved once per run, from the resolved libdeps folder.
+    
+    Args:
+        directory: Directory that may contain a .pio folder
+        
+    Returns:
+        List of (library_name, resolved_library_path) tuples (empty if there is no .pio/libdeps)
+    """
+    key = str(directory)
+    libraries = _PIO_LIBRARY_DIRS_CACHE.get(key)
+    if libraries is None:
+        libraries = []
+        if ".pio" in _child_dirs(key) and "libdeps" in _child_dirs(os.path.join(key, ".pio")):
+            pio_path = os.path.join(key, ".pio", "libdeps")
+            pio_real = os.path.realpath(pio_path)
+            for env_name, env_path in _child_dirs(pio_path).items():
+                env_real = _resolve_child(pio_real, env_name, env_path)
+                for lib_name, lib_path in _child_dirs(env_path).items():
+                    libraries.append((lib_name, _resolve_child(env_real, lib_name, lib_path)))
+        _PIO_LIBRARY_DIRS_CACHE[key] = libraries
+    return libraries
 
 
 def get_library_dir():
@@ -66,16 +155,47 @@ def get_library_dir():
     except NameError:
         pass
     
+    # The pre-build script asks for this several times; the answer only depends
+    # on where the search starts, so walk the tree once per start
+    cwd = os.getcwd()
+    project_dir = os.environ.get("CMAKE_PROJECT_DIR") or os.environ.get("PROJECT_DIR")
+    key = (str(search_start) if search_start else None, cwd, project_dir)
+    if key not in _LIBRARY_DIR_CACHE:
+        _LIBRARY_DIR_CACHE[key] = _find_library_dir(search_start, cwd, project_dir)
+    return _LIBRARY_DIR_CACHE[key]
+
+
+# get_library_dir results, keyed by (script directory, working directory, project directory)
+_LIBRARY_DIR_CACHE = {}
+get_library_dir.cache_clear = _LIBRARY_DIR_CACHE.clear
+
+
+def _find_library_dir(search_start, cwd, project_dir=None):
+    """Uncached implementation of get_library_dir."""
+    # Known locations first: the script's own directory, or (without __file__)
+    # the CMake FetchContent copy named by the environment or the build directory
+    if search_start and search_start.name == _SCRIPTS_DIR_NAME and os.path.isdir(search_start):
+        return search_start
+    if not search_start:
+        fast_candidates = [Path(cwd) / _SCRIPTS_DIR_NAME]
+        if project_dir:
+            fast_candidates.append(Path(project_dir) / "build" / "_deps" / _LIB_SRC_NAME / _SCRIPTS_DIR_NAME)
+        fast_candidates.append(Path(cwd) / "_deps" / _LIB_SRC_NAME / _SCRIPTS_DIR_NAME)
+        for candidate in fast_candidates:
+            if os.path.isdir(candidate):
+                # print(f"✓ Found library path at known location: {candidate}")
+                return candidate
+    
     # Start search from current working directory or script location
-    if search_start and search_start.exists():
+    if search_start and os.path.isdir(search_start):
         current = search_start
     else:
-        current = Path(os.getcwd())
+        current = Path(cwd)
     
     # Search up the directory tree
     for _ in range(15):  # Search up to 15 levels
-        potential = current / "springbootplusplus-data_scripts"
-        if potential.exists() and potential.is_dir():
+        if _SCRIPTS_DIR_NAME in _child_dirs(current):
+            potential = current / _SCRIPTS_DIR_NAME
             # print(f"✓ Found library path by searching up directory tree: {potential}")
             return potential
         parent = current.parent
@@ -101,19 +221,31 @@ def get_current_library_path(project_dir=None):
         Path: Full path to the springbootplusplus-data library root directory, or None if not found
     """
     # Get project directory if not provided
+    env_project_dir = os.environ.get("CMAKE_PROJECT_DIR") or os.environ.get("PROJECT_DIR")
     if project_dir is None:
-        project_dir = os.environ.get("CMAKE_PROJECT_DIR") or os.environ.get("PROJECT_DIR")
+        project_dir = env_project_dir
     
+    # Like get_library_dir, the answer only depends on the directories the search starts from
+    key = (str(project_dir) if project_dir else None, os.getcwd(), env_project_dir)
+    if key not in _CURRENT_LIBRARY_PATH_CACHE:
+        _CURRENT_LIBRARY_PATH_CACHE[key] = _find_current_library_path(project_dir)
+    return _CURRENT_LIBRARY_PATH_CACHE[key]
+
+
+# get_current_library_path results, keyed by (project directory, working directory, environment project directory)
+_CURRENT_LIBRARY_PATH_CACHE = {}
+get_current_library_path.cache_clear = _CURRENT_LIBRARY_PATH_CACHE.clear
+
+
+def _find_current_library_path(project_dir):
+    """Uncached implementation of get_current_library_path."""
     # First, try to get library scripts directory
     try:
         library_scripts_dir = get_library_dir()
         library_root = library_scripts_dir.parent
         
-        # If we're in a CMake FetchContent location, return the resolved path
-        if "springbootplusplus-data-src" in str(library_root) or "_deps" in str(library_root):
-            return library_root.resolve()
-        
-        # Otherwise, return the parent of scripts directory
+        # In a CMake FetchContent location (build/_deps/springbootplusplus-data-src) or not,
+        # the library root is the parent of the scripts directory
         return library_root.resolve()
     except ImportError:
         pass
@@ -121,32 +253,28 @@ def get_current_library_path(project_dir=None):
     # Try to find from project directory's build/_deps
     if project_dir:
         project_path = Path(project_dir)
-        build_deps = project_path / "build" / "_deps" / "springbootplusplus-data-src"
-        if build_deps.exists() and build_deps.is_dir():
+        build_deps = project_path / "build" / "_deps" / _LIB_SRC_NAME
+        if os.path.isdir(build_deps):
             # print(f"✓ Found springbootplusplus-data library path (CMake from project): {build_deps}")
             return build_deps.resolve()
     
     # Try to find from current working directory's build/_deps
     cwd = Path(os.getcwd())
-    if cwd.name == "build" or "_deps" in str(cwd):
-        deps_dir = cwd / "_deps" / "springbootplusplus-data-src"
-        if deps_dir.exists() and deps_dir.is_dir():
+    if cwd.name == "build" or "_deps" in cwd.parts:
+        deps_dir = cwd / "_deps" / _LIB_SRC_NAME
+        if os.path.isdir(deps_dir):
             # print(f"✓ Found springbootplusplus-data library path (CMake from CWD): {deps_dir}")
             return deps_dir.resolve()
     
     # Try PlatformIO location
-    current = cwd.resolve()
+    current = os.path.realpath(cwd)
     for _ in range(10):
-        pio_path = current / ".pio" / "libdeps"
-        if pio_path.exists() and pio_path.is_dir():
-            for env_dir in pio_path.iterdir():
-                if env_dir.is_dir():
-                    for lib_dir in env_dir.iterdir():
-                        if lib_dir.is_dir() and "springbootplusplus-data" in lib_dir.name.lower():
-                            # print(f"✓ Found springbootplusplus-data library path (PlatformIO): {lib_dir}")
-                            return lib_dir.resolve()
+        for lib_name, lib_path in _pio_library_dirs(current):
+            if _LIBRARY_NAME_SEARCH(lib_name):
+                # print(f"✓ Found springbootplusplus-data library path (PlatformIO): {lib_path}")
+                return Path(lib_path)
         
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             break
         current = parent
@@ -155,6 +283,31 @@ def get_current_library_path(project_dir=None):
     return None
 
 
+def _candidate_ancestors(start_paths, max_levels):
+    """
+    List the directories from each start path up through its parents, without repeats.
+    
+    Args:
+        start_paths: Directories to start from (resolved here)
+        max_levels: Maximum number of directories to take from each start path
+        
+    Returns:
+        List of resolved directory paths, in search order
+    """
+    candidates = {}
+    for start_path in start_paths:
+        current = os.path.realpath(start_path)
+        for _ in range(max_levels):
+            # A parent already listed from an earlier start may still have unseen parents
+            # beyond that start's level limit, so keep stepping up instead of stopping
+            candidates.setdefault(current, None)
+            parent = os.path.dirname(current)
+            if parent == current:  # Reached filesystem root
+                break
+            current = parent
+    return list(candidates)
+
+
 def get_all_library_dirs(project_dir=None):
     """
     Get all library directories (both scripts directories and root directories).
@@ -192,20 +345,21 @@ def get_all_library_dirs(project_dir=None):
         
         # Check CMake FetchContent location: build/_deps/
         build_deps = project_path / "build" / "_deps"
-        if build_deps.exists() and build_deps.is_dir():
+        if os.path.isdir(build_deps):
             # Find all library directories in _deps
-            for lib_dir in build_deps.iterdir():
-                if lib_dir.is_dir() and lib_dir.name.endswith("-src"):
-                    lib_root = lib_dir.resolve()
+            for lib_dir_name, lib_dir in _child_dirs(build_deps).items():
+                # Library name comes from the directory name (e.g., "arduinolib1-src" -> "arduinolib1")
+                src_match = _FETCHCONTENT_SRC_DIR_RE.fullmatch(lib_dir_name)
+                if src_match:
+                    lib_root = Path(lib_dir).resolve()
                     root_dirs.append(lib_root)
                     
-                    # Extract library name (e.g., "arduinolib1-src" -> "arduinolib1")
-                    lib_name = lib_dir.name[:-4]  # Remove "-src" suffix
+                    lib_name = src_match.group('name')
                     by_name[lib_name] = lib_root
                     
                     # Check for scripts directory
                     scripts_dir = lib_root / f"{lib_name}_scripts"
-                    if scripts_dir.exists() and scripts_dir.is_dir():
+                    if os.path.isdir(scripts_dir):
                         scripts_dirs.append(scripts_dir.resolve())
     
     # Add library directory (parent of springbootplusplus-data_scripts)
@@ -214,70 +368,56 @@ def get_all_library_dirs(project_dir=None):
         library_dir = library_scripts_dir.parent
         search_paths.append(library_dir)
         
-        # If we're in a CMake build, check sibling directories in _deps
-        if "springbootplusplus-data-src" in str(library_dir) or "_deps" in str(library_dir):
-            parent_deps = library_dir.parent
-            if parent_deps.exists() and parent_deps.name == "_deps":
-                # Find all library directories in _deps
-                for lib_dir in parent_deps.iterdir():
-                    if lib_dir.is_dir() and lib_dir.name.endswith("-src"):
-                        lib_root = lib_dir.resolve()
-                        if lib_root not in root_dirs:
-                            root_dirs.append(lib_root)
-                            
-                            # Extract library name
-                            lib_name = lib_dir.name[:-4]  # Remove "-src" suffix
-                            if lib_name not in by_name:
-                                by_name[lib_name] = lib_root
-                            
-                            # Check for scripts directory
-                            scripts_dir = lib_root / f"{lib_name}_scripts"
-                            if scripts_dir.exists() and scripts_dir.is_dir():
-                                scripts_dirs.append(scripts_dir.resolve())
+        # If we're in a CMake build (library directly inside _deps), check sibling directories in _deps
+        parent_deps = library_dir.parent
+        if parent_deps.name == "_deps" and os.path.isdir(parent_deps):
+            # Find all library directories in _deps
+            for lib_dir_name, lib_dir in _child_dirs(parent_deps).items():
+                src_match = _FETCHCONTENT_SRC_DIR_RE.fullmatch(lib_dir_name)
+                if src_match:
+                    lib_root = Path(lib_dir).resolve()
+                    if lib_root not in root_dirs:
+                        root_dirs.append(lib_root)
+                        
+                        # Extract library name
+                        lib_name = src_match.group('name')
+                        if lib_name not in by_name:
+                            by_name[lib_name] = lib_root
+                        
+                        # Check for scripts directory
+                        scripts_dir = lib_root / f"{lib_name}_scripts"
+                        if os.path.isdir(scripts_dir):
+                            scripts_dirs.append(scripts_dir.resolve())
     except ImportError:
         pass
     
-    # Search in each path for PlatformIO libraries
-    for start_path in search_paths:
-        current = start_path.resolve()
-        for _ in range(10):  # Search up to 10 levels
-            # Check in .pio/libdeps/ (PlatformIO location)
-            # Structure: .pio/libdeps/<env>/<library_name>/
-            pio_path = current / ".pio" / "libdeps"
-            if pio_path.exists() and pio_path.is_dir():
-                # Iterate through environment directories (e.g., esp32dev, native, etc.)
-                for env_dir in pio_path.iterdir():
-                    if env_dir.is_dir():
-                        # Now iterate through libraries in this environment
-                        for lib_dir in env_dir.iterdir():
-                            if lib_dir.is_dir():
-                                lib_root = lib_dir.resolve()
-                                if lib_root not in root_dirs:
-                                    root_dirs.append(lib_root)
-                                    
-                                    # Try to extract library name from directory name
-                                    lib_name = lib_dir.name
-                                    # Use library name as key (may have duplicates across envs, but that's okay)
-                                    if lib_name not in by_name:
-                                        by_name[lib_name] = lib_root
-                                    
-                                    # Check for scripts directory (various naming patterns)
-                                    possible_scripts_names = [
-                                        f"{lib_name}_scripts",
-                                        f"{lib_name.replace('-', '')}_scripts",
-                                        "scripts"
-                                    ]
-                                    for scripts_name in possible_scripts_names:
-                                        scripts_dir = lib_root / scripts_name
-                                        if scripts_dir.exists() and scripts_dir.is_dir():
-                                            if scripts_dir.resolve() not in scripts_dirs:
-                                                scripts_dirs.append(scripts_dir.resolve())
-                                            break
-            
-            parent = current.parent
-            if parent == current:  # Reached filesystem root
-                break
-            current = parent
+    # Search for PlatformIO libraries in each search path and its parents; the
+    # search paths share most of their parents, so each directory is checked once
+    for current in _candidate_ancestors(search_paths, 10):
+        # Check in .pio/libdeps/ (PlatformIO location)
+        # Structure: .pio/libdeps/<env>/<library_name>/
+        for lib_name, lib_path in _pio_library_dirs(current):
+            lib_root = Path(lib_path)
+            if lib_root not in root_dirs:
+                root_dirs.append(lib_root)
+                
+                # Use library name (from directory name) as key (may have duplicates across envs, but that's okay)
+                if lib_name not in by_name:
+                    by_name[lib_name] = lib_root
+                
+                # Check for scripts directory (various naming patterns)
+                possible_scripts_names = [
+                    f"{lib_name}_scripts",
+                    f"{lib_name.replace('-', '')}_scripts",
+                    "scripts"
+                ]
+                lib_children = _child_dirs(lib_root)
+                for scripts_name in possible_scripts_names:
+                    if scripts_name in lib_children:
+                        scripts_dir = Path(_resolve_child(lib_path, scripts_name, os.path.join(lib_path, scripts_name)))
+                        if scripts_dir not in scripts_dirs:
+                            scripts_dirs.append(scripts_dir)
+                        break
     
     return {
         'scripts_dirs': scripts_dirs,
@@ -316,15 +456,16 @@ def get_project_dir():
     # This is important for PlatformIO when script runs from library directory
     if not project_dir:
         # print("Searching for platformio.ini file...")
-        current = Path(os.getcwd()).resolve()
+        # Plain strings: no Path objects are built for the levels that do not match
+        current = os.path.realpath(os.getcwd())
         # print(f"Starting search from: {current}")
         for i in range(15):  # Search up to 15 levels
-            platformio_ini = current / "platformio.ini"
-            if platformio_ini.exists() and platformio_ini.is_file():
-                project_dir = str(current)
+            platformio_ini = os.path.join(current, "platformio.ini")
+            if os.path.isfile(platformio_ini):
+                project_dir = current
                 # print(f"✓ Found project directory by searching for platformio.ini: {project_dir}")
                 break
-            parent = current.parent
+            parent = os.path.dirname(current)
             if parent == current:  # Reached filesystem root
                 break
             current = parent
@@ -344,12 +485,17 @@ def get_project_dir():
 
 # Get library scripts directory and add it to Python path
 library_scripts_dir = get_library_dir()
-sys.path.insert(0, str(library_scripts_dir))
+if str(library_scripts_dir) not in sys.path:
+    sys.path.insert(0, str(library_scripts_dir))
 
 # Set serializable macro name to _Entity (for //@Entity annotation)
 # Using _Entity (with underscore) to match the default expected by execute_scripts
 os.environ['SERIALIZABLE_MACRO'] = '_Entity'
 
+# SPRINGBOOTPLUSPLUS_DATA_SKIP=1 turns the library scan, repository generation and
+# serialization into no-ops (e.g. for projects that don't use them)
+SKIP_PROCESSING = os.environ.get("SPRINGBOOTPLUSPLUS_DATA_SKIP") == "1"
+
 # Get project directory
 project_dir = get_project_dir()
 
@@ -382,8 +528,8 @@ try:
     except ImportError:
         HAS_GET_CLIENT_FILES = False
     
-    # Get all library directories
-    all_libs = get_all_library_dirs(project_dir)
+    # Get all library directories (none when processing is skipped)
+    all_libs = None if SKIP_PROCESSING else get_all_library_dirs(project_dir)
     
     if all_libs and all_libs.get('root_dirs'):
         # print(f"\nFound {len(all_libs['root_dirs'])} library directory(ies):")
@@ -394,15 +540,47 @@ try:
         # Also collect files from the client project
         all_header_files = []
         if HAS_GET_CLIENT_FILES:
+            # The client project walk (exclusions skipped) already covers libraries
+            # fetched under it (e.g. build/_deps), so walk it once up front and
+            # take those libraries' files from it instead of walking them again
+            client_files = None
+            if project_dir:
+                try:
+                    client_files = get_client_files(project_dir, skip_exclusions=True, file_extensions=['.h'])
+                except Exception as e:
+                    # print(f"⚠️  Warning: Could not get client files from {project_dir}: {e}")
+                    import traceback
+                    traceback.print_exc()
+            project_prefix = os.path.join(str(Path(project_dir).resolve()), '') if client_files is not None else None
+            
+            # Skip arduinojson library
+            libraries = [(lib_name, str(lib_dir)) for lib_name, lib_dir in sorted(all_libs['by_name'].items())
+                         if "arduinojson" not in lib_name.lower()]
+            
+            # Libraries outside the project are walked separately; the walks are
+            # I/O bound (scandir/stat release the GIL), so overlap them in threads
+            external_paths = [lib_path for _, lib_path in libraries
+                              if not (project_prefix and lib_path.startswith(project_prefix))]
+            
+            def _library_headers(lib_path):
+                # Get only .h files
+                return get_client_files(lib_path, skip_exclusions=True, file_extensions=['.h'])
+            
+            if len(external_paths) > 1:
+                from concurrent.futures import ThreadPoolExecutor
+                with ThreadPoolExecutor(max_workers=min(8, len(external_paths))) as executor:
+                    external_files = dict(zip(external_paths, executor.map(_library_headers, external_paths)))
+            else:
+                external_files = {lib_path: _library_headers(lib_path) for lib_path in external_paths}
+            
             # print(f"\n📄 Header files (.h) in all libraries (excluding arduinojson):")
             # print("=" * 60)
-            for lib_name, lib_dir in sorted(all_libs['by_name'].items()):
-                # Skip arduinojson library
-                if "arduinojson" in lib_name.lower():
-                    continue
-                
-                # Get only .h files
-                lib_files = get_client_files(str(lib_dir), skip_exclusions=True, file_extensions=['.h'])
+            for lib_name, lib_path in libraries:
+                if lib_path in external_files:
+                    lib_files = external_files[lib_path]
+                else:
+                    lib_prefix = os.path.join(lib_path, '')
+                    lib_files = [f for f in client_files if f.startswith(lib_prefix)]
                 if lib_files:
                     # print(f"\n{lib_name} ({len(lib_files)} .h file(s)):")
                     # for file_path in lib_files[:20]:  # Limit to first 20 files per library
@@ -415,27 +593,24 @@ try:
             
             # Also collect header files from the client project
             if project_dir:
-                try:
-                    client_files = get_client_files(project_dir, skip_exclusions=True, file_extensions=['.h'])
-                    if client_files:
-                        # print(f"\nClient Project ({len(client_files)} .h file(s)):")
-                        # for file_path in client_files[:20]:  # Limit to first 20 files
-                        #     print(f"   {file_path}")
-                        # if len(client_files) > 20:
-                        #     print(f"   ... and {len(client_files) - 20} more files")
-                        
-                        # Collect all client files for processing
-                        all_header_files.extend(client_files)
-                except Exception as e:
-                    # print(f"⚠️  Warning: Could not get client files from {project_dir}: {e}")
-                    import traceback
-                    traceback.print_exc()
+                if client_files:
+                    # print(f"\nClient Project ({len(client_files)} .h file(s)):")
+                    # for file_path in client_files[:20]:  # Limit to first 20 files
+                    #     print(f"   {file_path}")
+                    # if len(client_files) > 20:
+                    #     print(f"   ... and {len(client_files) - 20} more files")
+                    
+                    # Collect all client files for processing
+                    all_header_files.extend(client_files)
             else:
                 # print("⚠️  Warning: No project directory found, skipping client files")
                 pass
             
             # print("=" * 60)
             
+            # A header reached through both a library and the project walk is processed once
+            all_header_files = list(dict.fromkeys(all_header_files))
+            
             # Process each header file with implement_repository script
             if all_header_files:
                 # print(f"\n{'=' * 60}")
@@ -454,29 +629,21 @@ try:
                     except NameError:
                         # Fallback: use library_scripts_dir that we already found
                         springbootplusplus_data_scripts_dir = library_scripts_dir
-                    sys.path.insert(0, str(springbootplusplus_data_scripts_dir))
-                    
-                    from springbootplusplus_data_core.repository.process_repository import process_repository
+                    # Usually already on sys.path from start-up; don't add it a second time
+                    if str(springbootplusplus_data_scripts_dir) not in sys.path:
+                        sys.path.insert(0, str(springbootplusplus_data_scripts_dir))
                     
-                    processed_count = 0
-                    implemented_count = 0
+                    from springbootplusplus_data_core.repository.process_repository import process_repository_batch
                     
-                    for file_path in all_header_files:
-                        try:
-                            # Process file for repository implementation
-                            # This will detect @Repository annotation, create impl file, and add include
-                            result = process_repository(str(file_path), str(library_dir), dry_run=False)
-                            if result:
-                                # print(f"  ✓ Repository implementation generated for: {file_path}")
-                                implemented_count += 1
-                            else:
-                                # print(f"  - No repository found in: {file_path}")
-                                pass
-                            processed_count += 1
-                        except Exception as e:
-                            # print(f"⚠️  Warning: Error processing {file_path}: {e}")
-                            import traceback
-                            traceback.print_exc()
+                    # Processed in this interpreter (workers=1): this script is run unguarded as
+                    # __main__ by CMake and inside SCons, so pool workers started with "spawn" would
+                    # re-run the whole pre-build. Per-file errors are reported inside the batch and
+                    # count as not implemented
+                    # Headers without @Repository that are unchanged since the last build are skipped
+                    cache_dir = str(Path(library_dir) / ".springbootplusplus_data_cache")
+                    results = process_repository_batch(all_header_files, str(library_dir), dry_run=False, workers=1, cache_dir=cache_dir)
+                    processed_count = len(results)
+                    implemented_count = sum(1 for result in results.values() if result)
                     
                     # print(f"\n✅ Processed {processed_count} file(s), implemented {implemented_count} repository(ies)")
                     
@@ -505,8 +672,9 @@ try:
     # print(f"\n{'=' * 60}")
     # print("Importing and executing scripts...")
     # print(f"{'=' * 60}")
-    from springbootplusplus_data_execute_scripts import execute_scripts
-    execute_scripts(project_dir, library_dir)
+    if not SKIP_PROCESSING:
+        from springbootplusplus_data_execute_scripts import execute_scripts
+        execute_scripts(project_dir, library_dir)
 except ImportError as e:
     # print(f"⚠️  Error importing execute_scripts: {e}")
     import traceback